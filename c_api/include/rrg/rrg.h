@@ -1,6 +1,8 @@
 #ifndef RRG_H
 #define RRG_H
 
+#include <stdint.h>
+
 #include "rrg_constants.h"
 #include "rrg_errors.h"
 #include "rrg_preprocessor_macros.h"
@@ -110,7 +112,9 @@ RRG_API int RRG_Init(const RRG_Config *RRG_RESTRICT config, RRG_Handle *RRG_REST
  * Centimeters per Minute).
  *
  * @param handle Pointer to an initialized `RRG_Handle` structure.
- * @param setpoint Desired gas flow rate in SCCM.
+ * @param setpoint Desired gas flow rate in SCCM. Negative values, NaN and values
+ * whose thousandths do not fit in a signed 32-bit integer are rejected with
+ * `ERROR_RRG_INVALID_PARAMETER` without writing anything.
  * @return Returns `RRG_OK` on success, or an error code if the command fails.
  */
 RRG_API int RRG_SetFlow(RRG_Handle *RRG_RESTRICT handle, float setpoint) RRG_HOT;
@@ -128,6 +132,54 @@ RRG_API int RRG_SetFlow(RRG_Handle *RRG_RESTRICT handle, float setpoint) RRG_HOT
  */
 RRG_API int RRG_GetFlow(RRG_Handle *RRG_RESTRICT handle, float *RRG_RESTRICT flow) RRG_HOT;
 
+/**
+ * @brief Sends a new flow rate setpoint and reads back the current flow rate.
+ *
+ * Both setpoint registers are written with a single "Write multiple registers"
+ * (function code 16) request, followed immediately by the flow read. This
+ * takes two MODBUS transactions instead of the three needed by calling
+ * `RRG_SetFlow()` and `RRG_GetFlow()` one after another. The combined
+ * "Read/Write multiple registers" request (function code 23) is not used
+ * because the regulator only implements function codes 3, 6 and 16.
+ *
+ * @param handle Pointer to an initialized `RRG_Handle` structure.
+ * @param setpoint Desired gas flow rate in SCCM, validated as by `RRG_SetFlow()`.
+ * @param flow Pointer to a float variable where the retrieved flow value will
+ * be stored.
+ * @return Returns `RRG_OK` on success, or an error code if either request fails.
+ */
+RRG_API int RRG_SetAndGetFlow(RRG_Handle *RRG_RESTRICT handle, float setpoint, float *RRG_RESTRICT flow) RRG_HOT;
+
+/**
+ * @brief Reads a block of contiguous holding registers in one request.
+ *
+ * All registers are fetched with a single "Read holding registers"
+ * (function code 3) request, so related values such as the gas type and the
+ * current flow can be read together instead of one transaction each.
+ *
+ * @param handle Pointer to an initialized `RRG_Handle` structure.
+ * @param start Address of the first register to read.
+ * @param count Number of registers to read (1 to `MODBUS_MAX_READ_REGISTERS`).
+ * @param dest Pointer to an array of at least `count` elements that receives
+ * the register values.
+ * @return Returns `RRG_OK` on success, or an error code if the request fails.
+ */
+RRG_API int RRG_ReadRegisters(RRG_Handle *RRG_RESTRICT handle, int start, int count, uint16_t *RRG_RESTRICT dest) RRG_HOT;
+
+/**
+ * @brief Changes the response timeout of an open connection.
+ *
+ * Overrides the timeout configured by `RRG_Init()` for all following requests,
+ * so callers can wait only as long as the expected response needs.
+ *
+ * @param handle Pointer to an initialized `RRG_Handle` structure.
+ * @param sec Whole seconds of the timeout.
+ * @param usec Remaining microseconds of the timeout (0 to 999999).
+ * @return Returns `RRG_OK` on success, or an error code if the timeout is
+ * rejected.
+ */
+RRG_API int RRG_SetResponseTimeout(RRG_Handle *RRG_RESTRICT handle, uint32_t sec, uint32_t usec);
+
 /**
  * @brief Selects the gas type for the regulator.
  *
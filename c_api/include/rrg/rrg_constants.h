@@ -43,6 +43,12 @@
  */
 #define MODBUS_REGISTER_SETPOINT 2053
 
+/**
+ * @def RRG_SETPOINT_SCALE
+ * @brief The setpoint registers hold the setpoint in thousandths of SCCM.
+ */
+#define RRG_SETPOINT_SCALE 1000
+
 /**
  * @def MODBUS_REGISTER_FLOW
  * @brief MODBUS register for reading the current flow (2103).
@@ -4,6 +4,8 @@
 #include <modbus/modbus.h>
 #endif
 
+#include <stddef.h>
+
 #include "rrg.h"
 #include "rrg_constants.h"
 
@@ -62,6 +64,35 @@ int RRG_Init(const RRG_Config *RRG_RESTRICT config, RRG_Handle *RRG_RESTRICT han
     return RRG_OK;
 }
 
+/**
+ * @brief Converts a setpoint in SCCM into the two setpoint register values.
+ *
+ * The product is computed in double precision and rounded to the nearest
+ * thousandth, so it is never rounded past INT32_MAX as a float product
+ * would be, and values that cannot be represented are rejected instead of
+ * overflowing the integer conversion.
+ *
+ * @param setpoint Desired gas flow rate in SCCM.
+ * @param regs Receives the high 16 bits in regs[0] and the low 16 bits in regs[1].
+ * @return Returns `RRG_OK` on success, or `RRG_ERR` if the setpoint is negative,
+ * NaN or too large for the signed 32-bit register pair.
+ */
+static int _setpointToRegisters(float setpoint, uint16_t regs[2])
+{
+    double scaled = (double)setpoint * RRG_SETPOINT_SCALE + 0.5;
+    if (!(scaled >= 0.0 && scaled < (double)INT32_MAX + 1.0))
+    {
+        RRG_DEBUG_MSG("Setpoint out of range")
+        _setGlobalError(ERROR_RRG_INVALID_PARAMETER);
+        return RRG_ERR;
+    }
+
+    int32_t value = (int32_t)scaled;
+    regs[0] = (uint16_t)(value >> 16);    // Upper 16 bits.
+    regs[1] = (uint16_t)(value & 0xFFFF); // Lower 16 bits.
+    return RRG_OK;
+}
+
 int RRG_SetFlow(RRG_Handle *RRG_RESTRICT handle, float setpoint)
 {
     // 1. Validate input parameters.
@@ -72,18 +103,18 @@ int RRG_SetFlow(RRG_Handle *RRG_RESTRICT handle, float setpoint)
     // The MODBUS protocol stores 32-bit values across two 16-bit registers.
     // - The high 16 bits (most significant) are stored in one register.
     // - The low 16 bits (least significant) are stored in another register.
-    int value = (int)(setpoint * 1000), // Convert setpoint to an integer with three decimal places.
-        reg_high = value >> 16,         // Extract the upper 16 bits (shift right by 16).
-        reg_low = value & 0xFFFF;       // Extract the lower 16 bits (mask with 0xFFFF).
+    uint16_t regs[2];
+    if (_setpointToRegisters(setpoint, regs) == RRG_ERR)
+        return RRG_ERR;
 
     // 3. Write setpoint to MODBUS register 2053-2054.
-    if (modbus_write_register(handle->modbus_ctx, MODBUS_REGISTER_SETPOINT, reg_high) == MODBUS_ERR)
+    if (modbus_write_register(handle->modbus_ctx, MODBUS_REGISTER_SETPOINT, regs[0]) == MODBUS_ERR)
     {
         RRG_MODBUS_DEBUG_MSG;
         _setGlobalError(ERROR_RRG_FAILED_WRITE_REGISTER);
         return RRG_ERR;
     }
-    if (modbus_write_register(handle->modbus_ctx, MODBUS_REGISTER_SETPOINT + 1, reg_low) == MODBUS_ERR)
+    if (modbus_write_register(handle->modbus_ctx, MODBUS_REGISTER_SETPOINT + 1, regs[1]) == MODBUS_ERR)
     {
         RRG_MODBUS_DEBUG_MSG;
         _setGlobalError(ERROR_RRG_FAILED_WRITE_REGISTER);
@@ -117,6 +148,72 @@ int RRG_GetFlow(RRG_Handle *RRG_RESTRICT handle, float *RRG_RESTRICT flow)
     return RRG_OK;
 }
 
+int RRG_SetAndGetFlow(RRG_Handle *RRG_RESTRICT handle, float setpoint, float *RRG_RESTRICT flow)
+{
+    // 1. Validate input parameters.
+    RRG_CHECK_PTR_WITH_RETURN(handle);
+    RRG_CHECK_PTR_WITH_RETURN(handle->modbus_ctx);
+    RRG_CHECK_PTR_WITH_RETURN(flow);
+
+    // 2. Convert the setpoint the same way as RRG_SetFlow() does: high 16 bits first.
+    uint16_t regs[2];
+    if (_setpointToRegisters(setpoint, regs) == RRG_ERR)
+        return RRG_ERR;
+
+    // 3. Write setpoint to MODBUS registers 2053-2054 in a single request.
+    if (modbus_write_registers(handle->modbus_ctx, MODBUS_REGISTER_SETPOINT, 2, regs) == MODBUS_ERR)
+    {
+        RRG_MODBUS_DEBUG_MSG;
+        _setGlobalError(ERROR_RRG_FAILED_WRITE_REGISTER);
+        return RRG_ERR;
+    }
+
+    // 4. Read back the current flow without returning to the caller in between.
+    return RRG_GetFlow(handle, flow);
+}
+
+int RRG_ReadRegisters(RRG_Handle *RRG_RESTRICT handle, int start, int count, uint16_t *RRG_RESTRICT dest)
+{
+    // 1. Validate input parameters.
+    RRG_CHECK_PTR_WITH_RETURN(handle);
+    RRG_CHECK_PTR_WITH_RETURN(handle->modbus_ctx);
+    RRG_CHECK_PTR_WITH_RETURN(dest);
+    if (count < 1 || count > MODBUS_MAX_READ_REGISTERS)
+    {
+        _setGlobalError(ERROR_RRG_INVALID_PARAMETER);
+        return RRG_ERR;
+    }
+
+    // 2. Read the whole block with a single MODBUS request.
+    if (modbus_read_registers(handle->modbus_ctx, start, count, dest) == MODBUS_ERR)
+    {
+        RRG_MODBUS_DEBUG_MSG;
+        _setGlobalError(ERROR_RRG_FAILED_READ_REGISTER);
+        return RRG_ERR;
+    }
+
+    _resetGlobalError();
+    return RRG_OK;
+}
+
+int RRG_SetResponseTimeout(RRG_Handle *RRG_RESTRICT handle, uint32_t sec, uint32_t usec)
+{
+    // 1. Validate input parameters.
+    RRG_CHECK_PTR_WITH_RETURN(handle);
+    RRG_CHECK_PTR_WITH_RETURN(handle->modbus_ctx);
+
+    // 2. Apply the new timeout to the existing context.
+    if (modbus_set_response_timeout(handle->modbus_ctx, sec, usec) == MODBUS_ERR)
+    {
+        RRG_MODBUS_DEBUG_MSG;
+        _setGlobalError(ERROR_RRG_FAILED_SET_TIMEOUT);
+        return RRG_ERR;
+    }
+
+    _resetGlobalError();
+    return RRG_OK;
+}
+
 int RRG_SetGas(RRG_Handle *RRG_RESTRICT handle, int gas_id)
 {
     // 1. Validate input parameters.
@@ -141,6 +238,7 @@ void RRG_Close(RRG_Handle *RRG_RESTRICT handle)
     {
         modbus_close(handle->modbus_ctx);
         modbus_free(handle->modbus_ctx);
+        handle->modbus_ctx = NULL; // Makes a repeated RRG_Close() call a no-op.
     }
 }
 
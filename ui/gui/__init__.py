@@ -1,5 +1,6 @@
 # ПНППК/src/gui/__init__.py
 
 from .rrg_control_window import RRGControlWindow
+from .rrg_worker import RRGWorker
 
-__all__ = ["RRGControlWindow"]
+__all__ = ["RRGControlWindow", "RRGWorker"]
@@ -1,16 +1,31 @@
 # -*- coding: utf-8 -*-
 
 import os
-import datetime
+import sys
+import math
+import time
+import functools
+from collections import deque
 from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtWidgets import QMessageBox, QShortcut
 from PyQt5.QtGui import QKeySequence
 import serial.tools.list_ports
-from src.rrg import RRGController
 from src.relay import RelayController
 from src.config import ConfigLoader
+from src.rrg.rrg_base import STATUS_FLAG_NAMES
 from matplotlib.figure import Figure
+from matplotlib.transforms import nonsingular
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from .rrg_worker import RRGWorker
+
+# Optional: udev hotplug notifications on Linux. Without it the ports are polled.
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+if os.name == "nt":
+    import ctypes.wintypes
 
 RELAY_DEFAULT_BAUDRATE = 115200
 RELAY_DEFAULT_TIMEOUT = 10
@@ -21,29 +36,91 @@ RRG_DEFAULT_TIMEOUT = 50
 RRG_DEFAULT_SLAVE_ID = 1
 
 PLOT_UPDATE_TIME_TICK_MS = 50
+PLOT_MAX_POINTS = 60
+PLOT_REDRAW_EVERY_N = 1
+PLOT_REDRAW_EVERY_N_MAX = 100
+MAX_REDRAW_HZ = 5.0
+
+# The view limits change in steps, so most samples are blitted onto the cached background.
+PLOT_X_HEADROOM = 0.5  # Free time on the right of the data, as a fraction of its span
+PLOT_MIN_TIME_SPAN = 1.0 / 60.0  # Smallest time span used for the headroom, in minutes
+PLOT_Y_MARGIN = 0.25  # Flow margin above and below the data, as a fraction of its range
+PLOT_Y_SHRINK_RATIO = 0.25  # Refit the flow axis once the data fills less of it than this
+
+# Setpoints are sent as thousandths of SCCM in a signed 32-bit register pair. The
+# setpoint reaches the library as a C float: (2**31 - 1) / 1000 would round up to
+# 2147483.75 and overflow the pair, so the bound is the largest float32 below it.
+SETPOINT_MIN_SCCM = 0.0
+SETPOINT_MAX_SCCM = 2147483.5
+SETPOINT_DECIMALS = 3
+
+PORT_SCAN_INTERVAL_MS = 2000
+
+# Windows device notifications (see RRGControlWindow.nativeEvent).
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+
+CONFIG_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config"
+)
+
+ERROR_DIALOG_MIN_INTERVAL_S = 1.0
+
+LOG_MAX_BLOCK_COUNT = 500
+LOG_FLUSH_INTERVAL_MS = 200
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_ports():
+    """
+    Enumerates the serial ports. The result is cached until
+    _scan_ports.cache_clear() is called on a hotplug event.
+    """
+    return tuple(port.device for port in serial.tools.list_ports.comports())
 
 
 class RRGControlWindow(QtWidgets.QMainWindow):
+    # Requests to the RRG worker, delivered to its thread via queued connections.
+    rrgTurnOnRequested = QtCore.pyqtSignal(str, int, int, int)
+    rrgTurnOffRequested = QtCore.pyqtSignal()
+    rrgSetFlowRequested = QtCore.pyqtSignal(float)
+    rrgPollFlowRequested = QtCore.pyqtSignal()
+
+    # Emitted, possibly from a non-GUI thread, when the set of serial ports may have changed.
+    portsChanged = QtCore.pyqtSignal()
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("RRG Control Panel")
         self.resize(1200, 700)
 
-        self.rrg_controller = RRGController()
+        self._exiting = False  # Set once the user has confirmed the exit
+
+        self._init_rrg_worker()
+        # Every way out of the event loop (QApplication.quit(), Ctrl+C) passes through here,
+        # while closeEvent and _confirm_close only cover the window-driven exits.
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self._on_about_to_quit)
         self.relay_controller = RelayController()
         self.config_loader = ConfigLoader()
 
-        self.available_ports = self._get_available_ports()
+        self._set_available_ports(self._get_available_ports())
 
         self._create_toolbar()
         self._create_central_widget()
+        self._create_status_bar()
+
+        # Rebuild the port combo boxes only when the OS reports a different set of ports.
+        self.portsChanged.connect(self._refresh_ports)
+        self._start_port_monitor()
 
         QShortcut(QKeySequence("Ctrl+W"), self, activated=self._confirm_close)
         QShortcut(QKeySequence("Ctrl+Q"), self, activated=self._confirm_close)
 
+        self._ui_enabled = True
         if len(self.available_ports) < 2:
             self._log_message("Not enough serial ports available. UI is disabled.")
-            self._disable_ui()
+            self._set_ui_enabled(False)
 
         self._load_config_data()
 
@@ -51,6 +128,24 @@ class RRGControlWindow(QtWidgets.QMainWindow):
         """
         @brief Overrides the window close event to prompt the user for confirmation
                and safely close connections.
+        @details
+        If the exit has already been confirmed (e.g. via Ctrl+W), the window is closed
+        without asking again.
+        """
+        if self._exiting:
+            event.accept()
+            return
+
+        if self._prompt_exit():
+            self._shutdown()
+            event.accept()
+        else:
+            event.ignore()
+
+    def _prompt_exit(self) -> bool:
+        """
+        @brief Asks the user to confirm the exit.
+        @return True if the user confirmed, False otherwise.
         """
         reply = QMessageBox.question(
             self,
@@ -59,81 +154,235 @@ class RRGControlWindow(QtWidgets.QMainWindow):
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
-        if reply == QMessageBox.Yes:
-            self._close_connections()
-            event.accept()
-        else:
-            event.ignore()
+        return reply == QMessageBox.Yes
+
+    def _shutdown(self):
+        """
+        @brief Closes the device connections and stops the RRG worker.
+        @details
+        Marks the window as exiting first, so a subsequent closeEvent neither prompts
+        again nor closes the connections a second time.
+        """
+        self._exiting = True
+        if self._udev_observer is not None:
+            self._udev_observer.send_stop()
+        self._close_connections()
+        self._stop_rrg_worker()
+
+    @QtCore.pyqtSlot()
+    def _on_about_to_quit(self):
+        """
+        @brief Releases the devices and stops the RRG worker if the application quits
+               without going through the exit confirmation.
+        """
+        if not self._exiting:
+            self._shutdown()
+
+    def _init_rrg_worker(self):
+        """
+        @brief Starts the thread that performs all blocking RRG I/O.
+        @details
+        The worker owns the RRGController. The GUI thread only uses `self.rrg_controller`
+        for non-blocking state queries; every MODBUS operation goes through the worker.
+        """
+        self._rrg_thread = QtCore.QThread(self)
+        self._worker = RRGWorker()
+        self._worker.moveToThread(self._rrg_thread)
+        self.rrg_controller = self._worker.controller
+
+        self.rrgTurnOnRequested.connect(self._worker.turnOn)
+        self.rrgTurnOffRequested.connect(self._worker.turnOff)
+        self.rrgSetFlowRequested.connect(self._worker.setFlow)
+        self.rrgPollFlowRequested.connect(self._worker.pollFlow)
+
+        self._worker.turnedOn.connect(self._on_rrg_turned_on)
+        self._worker.turnedOff.connect(self._on_rrg_turned_off)
+        self._worker.flowSet.connect(self._on_flow_set)
+        self._worker.flowReady.connect(self._on_flow_ready)
+        self._worker.telemetryReady.connect(self._on_telemetry_ready)
+        self._worker.errorOccurred.connect(self._rrg_show_error_msg)
+
+        # Release the device in the worker thread right before it finishes.
+        self._rrg_thread.finished.connect(self._worker.shutdown)
+        self._rrg_thread.start()
+
+    def _stop_rrg_worker(self):
+        """
+        @brief Stops the RRG worker thread and waits until the device is released.
+        @details
+        Does nothing if the thread has already finished.
+        """
+        if self._rrg_thread.isFinished():
+            return
+        self._rrg_thread.quit()
+        self._rrg_thread.wait()
 
     def _init_graph(self):
         """Initializes the Matplotlib graph for displaying flow over time."""
-        self.figure = Figure(figsize=(20, 10))
+        # No layout engine: the margins are fixed once instead of being solved on each draw.
+        self.figure = Figure(figsize=(20, 10), dpi=96, layout="none")
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setMinimumHeight(500)
         self.ax = self.figure.add_subplot(111)
+        self.figure.subplots_adjust(left=0.08, right=0.98, top=0.93, bottom=0.12)
 
+        # Axes decorations are configured here only; the update path never touches them,
+        # since they are part of the cached blitting background.
         self.ax.set_xlabel("Time (minutes)")
         self.ax.set_ylabel("Flow (SCCM)")
         self.ax.set_title("Gas Flow over Time")
 
-        self.flow_data = []  # Stores (time in minutes, flow)
-        self.start_time = datetime.datetime.now()  # Set start time for reference
+        self.ax.minorticks_on()
+        self.ax.grid(True, which="major", linestyle="-", linewidth=0.8)
+        self.ax.grid(True, which="minor", linestyle="--", linewidth=0.5, alpha=0.5)
+
+        # The line is created once and only its data is updated on each tick.
+        # It is animated, so full redraws skip it and it is blitted on top.
+        (self._line,) = self.ax.plot([], [], marker="o", linestyle="-", animated=True)
+
+        # Only the last PLOT_MAX_POINTS samples are kept (time in minutes, flow).
+        self._times = deque(maxlen=PLOT_MAX_POINTS)
+        self._flows = deque(maxlen=PLOT_MAX_POINTS)
+        self._t0 = time.monotonic()  # Set start time for reference
+        self._tick_counter = 0  # Samples received, used to decimate redraws
+        self._inflight = False  # A flow poll is queued or running in the RRG worker
+        self._last_draw = 0.0  # time.monotonic() of the last graph repaint
+
+        # Repaints a sample that arrived too soon after the previous repaint, once the
+        # MAX_REDRAW_HZ interval has passed, so the graph never lags behind the data.
+        self._redraw_timer = QtCore.QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._redraw_line)
 
         # Add the canvas below UI elements
         self.centralWidget().layout().addWidget(self.canvas)
 
-    def _update_graph(self):
+        # Cache the static background (axes, labels, grid) for blitting. It is
+        # re-captured on every full redraw, e.g. after the canvas is resized.
+        self._bg = None
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+        self.canvas.draw()
+
+    def _on_canvas_draw(self, event):
+        """Re-captures the cached background after a full canvas redraw."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._line)
+
+    @QtCore.pyqtSlot()
+    def _poll_flow(self):
+        """
+        Asks the RRG worker for the current flow, unless the previous request has not
+        been answered yet. This keeps requests from piling up on a slow serial line.
         """
-        Queries the current flow from the RRG controller, appends the data point,
+        if self._inflight:
+            return
+        self._inflight = True
+        self.rrgPollFlowRequested.emit()
+
+    @QtCore.pyqtSlot(int, float)
+    def _on_flow_ready(self, err, flow):
+        """
+        Receives the flow polled by the RRG worker, appends the data point,
         and updates the Matplotlib graph.
         """
-        if self.rrg_controller.IsDisconnected():
+        self._inflight = False
+        if err == self.rrg_controller.RRG_OK:
+            self._add_flow_sample(flow)
+
+    @QtCore.pyqtSlot(int, float)
+    def _on_telemetry_ready(self, status, temperature):
+        """
+        Shows the device temperature and its active status flags, in the
+        [MOV][TOV] notation of the device manual, in the status bar.
+        """
+        telemetry = (status, temperature)
+        if telemetry == self._telemetry:
             return
+        self._telemetry = telemetry
+        flags = "".join(f"[{name}]" for flag, name in STATUS_FLAG_NAMES if status & flag)
+        self._telemetry_label.setText(f"Temperature: {temperature:.2f} °C {flags}".rstrip())
 
-        err, flow = self.rrg_controller.GetFlow()
-        current_time = datetime.datetime.now()
-        elapsed_minutes = (
-            current_time - self.start_time
-        ).total_seconds() / 60  # Convert to minutes
+    def _add_flow_sample(self, flow):
+        """
+        Appends a flow reading to the graph data and repaints the graph,
+        subject to the redraw decimation and rate limit.
+        """
+        elapsed_minutes = (time.monotonic() - self._t0) / 60.0  # Convert to minutes
+        self._times.append(elapsed_minutes)
+        self._flows.append(flow)
+        self._log_message(
+            f"Current flow is {flow} [cm3/min] at time moment {elapsed_minutes:.2f} [min]"
+        )
 
-        if err == self.rrg_controller.RRG_OK:
-            self.flow_data.append((elapsed_minutes, flow))
-            self.flow_data = self.flow_data[-60:]  # Keep only last 60 data points
+        # Every sample is recorded, but the graph is repainted only every Nth one.
+        self._line.set_data(self._times, self._flows)
+        self._tick_counter += 1
+        if self._tick_counter % self.redraw_every_n_spin_box.value():
+            return
 
-            times = [t for t, _ in self.flow_data]
-            flows = [f for _, f in self.flow_data]
+        # Never repaint faster than MAX_REDRAW_HZ, whatever the polling rate is: a sample
+        # that comes too soon is repainted by the trailing redraw timer instead.
+        wait = (1.0 / MAX_REDRAW_HZ) - (time.monotonic() - self._last_draw)
+        if wait > 0:
+            if not self._redraw_timer.isActive():
+                self._redraw_timer.start(math.ceil(wait * 1000))
+            return
 
-            self.ax.clear()
-            self.ax.plot(times, flows, marker="o", linestyle="-")
+        self._redraw_timer.stop()
+        self._redraw_line()
 
-            self.ax.set_xlabel("Time (minutes)")
-            self.ax.set_ylabel("Flow (SCCM)")
-            self.ax.set_title("Gas Flow over Time")
+    def _update_view_limits(self):
+        """
+        Fits the axes limits to the data only when it leaves the current view.
+        The time axis then gets PLOT_X_HEADROOM of free space on the right, and
+        the flow axis a PLOT_Y_MARGIN margin, so the following samples usually
+        fit the same view. Returns True if the limits changed.
+        """
+        changed = False
+
+        t_first, t_last = self._times[0], self._times[-1]
+        xmin, xmax = self.ax.get_xlim()
+        if len(self._times) == 1 or t_first < xmin or t_last > xmax:
+            span = max(t_last - t_first, PLOT_MIN_TIME_SPAN)
+            self.ax.set_xlim(t_first, t_last + span * PLOT_X_HEADROOM)
+            changed = True
+
+        low, high = min(self._flows), max(self._flows)
+        ymin, ymax = self.ax.get_ylim()
+        if low < ymin or high > ymax or (high - low) < (ymax - ymin) * PLOT_Y_SHRINK_RATIO:
+            margin = (high - low) * PLOT_Y_MARGIN
+            limits = nonsingular(low - margin, high + margin)
+            if limits != (ymin, ymax):
+                self.ax.set_ylim(*limits)
+                changed = True
+
+        return changed
 
-            self.ax.minorticks_on()
-            self.ax.grid(True, which="major", linestyle="-", linewidth=0.8)
-            self.ax.grid(True, which="minor", linestyle="--", linewidth=0.5, alpha=0.5)
+    @QtCore.pyqtSlot()
+    def _redraw_line(self):
+        """
+        Redraws the flow line on top of the cached background. Falls back to a
+        full redraw when the view limits change, since the cached background
+        then holds stale tick labels.
+        """
+        if self._update_view_limits() or self._bg is None:
+            # The background is re-captured by _on_canvas_draw once the canvas is redrawn.
+            self._bg = None
+            self.canvas.draw_idle()
+            self._last_draw = time.monotonic()
+            return
 
-            self.canvas.draw()
-            self._log_message(
-                f"Current flow is {flow} [cm3/min] at time moment {elapsed_minutes:.2f} [min]"
-            )
-        else:
-            self._rrg_show_error_msg()
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._line)
+        self.canvas.blit(self.ax.bbox)
+        self._last_draw = time.monotonic()
 
     def _confirm_close(self):
         """
         @brief Called by keyboard shortcuts (Ctrl+W, Ctrl+Q) to ask for exit confirmation.
         """
-        reply = QMessageBox.question(
-            self,
-            "Confirm Exit",
-            "Are you sure you want to exit?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
-        )
-        if reply == QMessageBox.Yes:
-            self._close_connections()
+        if self._prompt_exit():
+            self._shutdown()
             QtWidgets.QApplication.quit()
 
     def _open_connections(self):
@@ -151,23 +400,33 @@ class RRGControlWindow(QtWidgets.QMainWindow):
         else:
             self._log_message(f"Relay device connected on port {relay_port}.")
 
-        # 2. Connect to the Gas Flow Regulator
-        rrg_port = self.combo_port_2.currentText()
-        rrg_err = self.rrg_controller.TurnOn(
+        # 2. Connect to the Gas Flow Regulator (the result arrives in _on_rrg_turned_on)
+        self.rrgTurnOnRequested.emit(
             "/dev/ttyUSB0",
-            baudrate=self.rrg_config_dict.get("baudrate", RRG_DEFAULT_BAUDRATE),
-            slave_id=self.rrg_config_dict.get("slave_id", RRG_DEFAULT_SLAVE_ID),
-            timeout=self.rrg_config_dict.get("timeout", RRG_DEFAULT_TIMEOUT),
+            self.rrg_config_dict.get("baudrate", RRG_DEFAULT_BAUDRATE),
+            self.rrg_config_dict.get("slave_id", RRG_DEFAULT_SLAVE_ID),
+            self.rrg_config_dict.get("timeout", RRG_DEFAULT_TIMEOUT),
         )
-        if rrg_err != self.rrg_controller.RRG_OK:
-            self._rrg_show_error_msg()
+
+    @QtCore.pyqtSlot(int, str)
+    def _on_rrg_turned_on(self, err, rrg_port):
+        if err != self.rrg_controller.RRG_OK:
             self.toggle_rrg_button.setChecked(False)
             self.toggle_rrg_button.setText("Turn RRG ON")
         else:
             self._log_message(
                 f"Gas Flow Regulator device connected on port {rrg_port}."
             )
+            # Switched off while connecting: the queued TurnOff disconnects it again.
+            if not self.toggle_rrg_button.isChecked():
+                return
             self.toggle_rrg_button.setText("Turn RRG OFF")
+            self.graph_timer.start(PLOT_UPDATE_TIME_TICK_MS)
+
+    @QtCore.pyqtSlot(int)
+    def _on_rrg_turned_off(self, err):
+        if err == self.rrg_controller.RRG_OK:
+            self._log_message("Gas Flow Regulator device disconnected.")
 
     def _close_connections(self):
         """
@@ -175,14 +434,12 @@ class RRGControlWindow(QtWidgets.QMainWindow):
         @details
         This method calls the appropriate TurnOff/close methods on the controllers.
         """
-        # 1. Turn off the Gas Flow Regulator
-        if self.rrg_controller.IsConnected():
-            rrg_err = self.rrg_controller.TurnOff()
-            if rrg_err != self.rrg_controller.RRG_OK:
-                self._rrg_show_error_msg()
-            else:
-                self._log_message("Gas Flow Regulator device disconnected.")
-            self.toggle_rrg_button.setText("Turn RRG ON")
+        # 1. Turn off the Gas Flow Regulator (the result arrives in _on_rrg_turned_off).
+        # Always requested: a TurnOn may still be queued in the worker, and the worker
+        # ignores the request if nothing is connected.
+        self.graph_timer.stop()
+        self.rrgTurnOffRequested.emit()
+        self.toggle_rrg_button.setText("Turn RRG ON")
 
         # 2. Turn off the Relay
         if self.relay_controller.IsConnected():
@@ -193,12 +450,8 @@ class RRGControlWindow(QtWidgets.QMainWindow):
                 self._log_message("Relay device disconnected.")
 
     def _load_config_data(self):
-        rrg_config_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "config", "rrg.yaml"
-        )
-        relay_config_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "config", "relay.yaml"
-        )
+        rrg_config_path = os.path.join(CONFIG_DIR, "rrg.yaml")
+        relay_config_path = os.path.join(CONFIG_DIR, "relay.yaml")
         try:
             self.rrg_config_dict = self.config_loader.load_config(rrg_config_path)
             self.relay_config_dict = self.config_loader.load_config(relay_config_path)
@@ -206,64 +459,169 @@ class RRGControlWindow(QtWidgets.QMainWindow):
             self._log_message(f"Failed to load config: {e}")
 
     def _get_available_ports(self):
-        ports = serial.tools.list_ports.comports()
-        available = [port.device for port in ports]
-        return available
+        return _scan_ports()
+
+    def _set_available_ports(self, ports):
+        # Ports are kept as a tuple plus a port -> row map for constant-time lookups.
+        self.available_ports = tuple(ports)
+        self._port_index = {port: i for i, port in enumerate(self.available_ports)}
+
+    def _start_port_monitor(self):
+        """
+        Subscribes to OS hotplug notifications, so the ports are enumerated again only
+        when a device appears or disappears: udev events on Linux when pyudev is
+        installed, WM_DEVICECHANGE on Windows (see nativeEvent). Elsewhere the ports
+        are re-scanned every PORT_SCAN_INTERVAL_MS.
+        """
+        self._udev_observer = None
+        if os.name == "nt":
+            return
+
+        if pyudev is not None and sys.platform.startswith("linux"):
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by(subsystem="tty")
+            self._udev_observer = pyudev.MonitorObserver(
+                monitor, callback=lambda device: self._invalidate_ports()
+            )
+            self._udev_observer.start()
+            return
+
+        self._port_scan_timer = QtCore.QTimer(self)
+        self._port_scan_timer.timeout.connect(self._invalidate_ports)
+        self._port_scan_timer.start(PORT_SCAN_INTERVAL_MS)
+
+    def _invalidate_ports(self):
+        """Drops the cached port list and asks the GUI thread to re-read it."""
+        _scan_ports.cache_clear()
+        self.portsChanged.emit()
+
+    # Overridden only on Windows: elsewhere it would cost a Python call per native event.
+    if os.name == "nt":
+
+        def nativeEvent(self, eventType, message):
+            """
+            Re-reads the serial ports when Windows broadcasts a device arrival or removal.
+            """
+            if bytes(eventType) == b"windows_generic_MSG":
+                msg = ctypes.wintypes.MSG.from_address(int(message))
+                if msg.message == WM_DEVICECHANGE and msg.wParam in (
+                    DBT_DEVICEARRIVAL,
+                    DBT_DEVICEREMOVECOMPLETE,
+                ):
+                    self._invalidate_ports()
+            return super().nativeEvent(eventType, message)
 
-    def _disable_ui(self):
-        for widget in self.findChildren(QtWidgets.QWidget):
-            widget.setEnabled(False)
+    @QtCore.pyqtSlot()
+    def _refresh_ports(self):
+        ports = self._get_available_ports()
+        if ports != self.available_ports:
+            self._set_available_ports(ports)
+            self._update_combo_boxes()
+
+            if len(ports) >= 2 and not self._ui_enabled:
+                self._log_message("Serial ports available. UI is enabled.")
+                self._set_ui_enabled(True)
+            elif len(ports) < 2 and self._ui_enabled and self.rrg_controller.IsDisconnected():
+                self._log_message("Not enough serial ports available. UI is disabled.")
+                self._set_ui_enabled(False)
+
+    def _set_ui_enabled(self, enabled):
+        # Qt propagates the enabled state to every child of the two containers.
+        self._ui_enabled = enabled
+        self.toolbar.setEnabled(enabled)
+        self.central_widget.setEnabled(enabled)
 
     def _create_toolbar(self):
         self.toolbar = QtWidgets.QToolBar("COM Port Selection", self)
         self.addToolBar(self.toolbar)
 
         self.combo_port_1 = QtWidgets.QComboBox(self)
+        self.combo_port_1.setModel(QtGui.QStandardItemModel(self.combo_port_1))
         self.combo_port_1.setToolTip("Select COM port for the Relay (Реле)")
         self.toolbar.addWidget(self.combo_port_1)
 
         self.toolbar.addSeparator()
 
         self.combo_port_2 = QtWidgets.QComboBox(self)
+        self.combo_port_2.setModel(QtGui.QStandardItemModel(self.combo_port_2))
         self.combo_port_2.setToolTip("Select COM port for Gas Flow Regulator (РРГ)")
         self.toolbar.addWidget(self.combo_port_2)
 
-        self._update_combo_boxes(initial=True)
+        self.toolbar.addSeparator()
+
+        self.toolbar.addWidget(QtWidgets.QLabel("Redraw every N samples:", self))
+        self.redraw_every_n_spin_box = QtWidgets.QSpinBox(self)
+        self.redraw_every_n_spin_box.setRange(1, PLOT_REDRAW_EVERY_N_MAX)
+        self.redraw_every_n_spin_box.setValue(PLOT_REDRAW_EVERY_N)
+        self.redraw_every_n_spin_box.setToolTip(
+            "Repaint the graph only every N flow samples to reduce CPU usage"
+        )
+        self.toolbar.addWidget(self.redraw_every_n_spin_box)
+
+        self._update_combo_boxes()
 
         self.combo_port_1.currentIndexChanged.connect(self._on_combo_changed)
         self.combo_port_2.currentIndexChanged.connect(self._on_combo_changed)
 
-    def _update_combo_boxes(self, initial=False):
+    def _update_combo_boxes(self):
+        """
+        Fills both combo boxes with every available port, keeping the current
+        selections, and disables in each one the port selected in the other.
+        Only needed at startup and when the set of ports changes; selection
+        changes are handled by _on_combo_changed.
+        """
         current1 = self.combo_port_1.currentText()
         current2 = self.combo_port_2.currentText()
 
-        self.combo_port_1.blockSignals(True)
-        self.combo_port_2.blockSignals(True)
-
-        self.combo_port_1.clear()
-        self.combo_port_2.clear()
-
-        ports_for_combo1 = list(self.available_ports)
-        ports_for_combo2 = list(self.available_ports)
-        if not initial:
-            if current2 in ports_for_combo1:
-                ports_for_combo1.remove(current2)
-            if current1 in ports_for_combo2:
-                ports_for_combo2.remove(current1)
+        with QtCore.QSignalBlocker(self.combo_port_1), QtCore.QSignalBlocker(
+            self.combo_port_2
+        ):
+            for combo, current in (
+                (self.combo_port_1, current1),
+                (self.combo_port_2, current2),
+            ):
+                model = combo.model()
+                model.clear()
+                for port in self.available_ports:
+                    model.appendRow(QtGui.QStandardItem(port))
+                index = self._port_index.get(current)
+                if index is not None:
+                    combo.setCurrentIndex(index)
+
+            # Both combos start on the first port; move the RRG one to another port.
+            if (
+                self.combo_port_2.currentText() == self.combo_port_1.currentText()
+                and self.combo_port_2.count() > 1
+            ):
+                self.combo_port_2.setCurrentIndex(
+                    1 if self.combo_port_1.currentIndex() == 0 else 0
+                )
+
+        self._excluded_ports = {}
+        self._set_excluded_port(self.combo_port_1, self.combo_port_2.currentText())
+        self._set_excluded_port(self.combo_port_2, self.combo_port_1.currentText())
 
-        self.combo_port_1.addItems(ports_for_combo1)
-        self.combo_port_2.addItems(ports_for_combo2)
-
-        if current1 in ports_for_combo1:
-            self.combo_port_1.setCurrentIndex(ports_for_combo1.index(current1))
-        if current2 in ports_for_combo2:
-            self.combo_port_2.setCurrentIndex(ports_for_combo2.index(current2))
+    def _on_combo_changed(self):
+        changed = self.sender()
+        other = self.combo_port_2 if changed is self.combo_port_1 else self.combo_port_1
+        self._set_excluded_port(other, changed.currentText())
 
-        self.combo_port_1.blockSignals(False)
-        self.combo_port_2.blockSignals(False)
+    def _set_excluded_port(self, combo, port):
+        """
+        Disables the item for `port` in `combo` and re-enables the item that was
+        disabled before. The items stay in place, so the model is never reset.
+        """
+        model = combo.model()
+        previous = self._excluded_ports.get(combo)
+        if previous == port:
+            return
 
-    def _on_combo_changed(self):
-        self._update_combo_boxes()
+        # Rows follow available_ports, so _port_index gives each item directly.
+        if previous in self._port_index:
+            model.item(self._port_index[previous]).setEnabled(True)
+        if port in self._port_index:
+            model.item(self._port_index[port]).setEnabled(False)
+        self._excluded_ports[combo] = port
 
     def _create_central_widget(self):
         self.central_widget = QtWidgets.QWidget(self)
@@ -281,7 +639,10 @@ class RRGControlWindow(QtWidgets.QMainWindow):
 
         self.setpoint_line_edit = QtWidgets.QLineEdit(self)
         self.setpoint_line_edit.setPlaceholderText("Enter flow setpoint (float)")
-        double_validator = QtGui.QDoubleValidator(self)
+        double_validator = QtGui.QDoubleValidator(
+            SETPOINT_MIN_SCCM, SETPOINT_MAX_SCCM, SETPOINT_DECIMALS, self
+        )
+        double_validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
         self.setpoint_line_edit.setValidator(double_validator)
         form_layout.addWidget(self.setpoint_line_edit)
 
@@ -294,14 +655,22 @@ class RRGControlWindow(QtWidgets.QMainWindow):
         # --- Initialize the graph ---
         self._init_graph()
         self.graph_timer = QtCore.QTimer(self)
-        self.graph_timer.timeout.connect(self._update_graph)
-        self.graph_timer.start(PLOT_UPDATE_TIME_TICK_MS)
+        self.graph_timer.timeout.connect(self._poll_flow)
+        self.graph_timer.stop()  # Idle until the RRG is connected
 
-        self.flow_display = QtWidgets.QTextEdit(self)
+        self.flow_display = QtWidgets.QPlainTextEdit(self)
         self.flow_display.setReadOnly(True)
+        self.flow_display.setMaximumBlockCount(LOG_MAX_BLOCK_COUNT)
         self.flow_display.setPlaceholderText("Current flow will be displayed here...")
         layout.addWidget(self.flow_display)
 
+        # Log lines are buffered and appended in one batch per flush interval.
+        self._log_buf = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
     @QtCore.pyqtSlot()
     def _toggle_rrg(self):
         if self.toggle_rrg_button.isChecked():
@@ -316,57 +685,99 @@ class RRGControlWindow(QtWidgets.QMainWindow):
             self._log_message("Setpoint value is empty.")
             return
 
-        try:
-            setpoint = float(text)
-        except ValueError:
+        # The validator already checked the range and format; its locale parses the number.
+        validator = self.setpoint_line_edit.validator()
+        state, _, _ = validator.validate(text, 0)
+        if state != QtGui.QValidator.Acceptable:
             self._log_message("Invalid setpoint value entered.")
             return
+        setpoint, _ = validator.locale().toDouble(text)
 
         if self.rrg_controller.IsDisconnected():
-            self._rrg_show_error_msg()
+            self._rrg_show_error_msg(self.rrg_controller.GetLastError())
             return
 
-        err = self.rrg_controller.SetFlow(setpoint)
-        if err != self.rrg_controller.RRG_OK:
-            self._rrg_show_error_msg()
-        else:
+        # The result arrives in _on_flow_set
+        self.rrgSetFlowRequested.emit(setpoint)
+
+    @QtCore.pyqtSlot(int, float, float)
+    def _on_flow_set(self, err, setpoint, flow):
+        if err == self.rrg_controller.RRG_OK:
             self._log_message(f"Setpoint {setpoint} sent successfully.")
+            # The flow was read back together with the setpoint write.
+            self._add_flow_sample(flow)
 
     def _log_message(self, message: str):
-        self.flow_display.append(message)
+        self._log_buf.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
 
-    def _rrg_show_error_msg(self):
-        rrg_error = self.rrg_controller.GetLastError()
+    @QtCore.pyqtSlot()
+    def _flush_log(self):
+        self.flow_display.appendPlainText("\n".join(self._log_buf))
+        self._log_buf.clear()
+
+    @QtCore.pyqtSlot(object)
+    def _rrg_show_error_msg(self, rrg_error):
+        """
+        @brief Shows the RRG error reported by RRGController.GetLastError().
+        @param rrg_error Value of GetLastError() captured in the RRG worker thread.
+        """
         if isinstance(rrg_error, str):
-            QMessageBox.critical(
-                self,
-                "Gas Flow Regulator Error",
-                f"{self.rrg_controller.GetLastError()}",
-            )
+            message = f"{rrg_error}"
         elif isinstance(rrg_error, int) and rrg_error == -1:
-            QMessageBox.critical(
-                self,
-                "Gas Flow Regulator Error",
-                "Gas Flow Regulator device is not connected",
-            )
+            message = "Gas Flow Regulator device is not connected"
         else:
-            QMessageBox.critical(
-                self, "Gas Flow Regulator Error", "Unknown error occured"
-            )
+            message = "Unknown error occured"
+        self._show_error("Gas Flow Regulator Error", message)
 
     def _relay_show_error_msg(self):
         relay_error = self.relay_controller.GetLastError()
         if isinstance(relay_error, str):
-            QMessageBox.critical(
-                self,
-                "Gas Flow Regulator Error",
-                f"{self.relay_controller.GetLastError()}",
-            )
+            message = f"{relay_error}"
         elif isinstance(relay_error, int) and relay_error == -1:
-            QMessageBox.critical(
-                self, "Gas Flow Regulator Error", "Relay device is not connected"
-            )
+            message = "Relay device is not connected"
         else:
-            QMessageBox.critical(
-                self, "Gas Flow Regulator Error", "Unknown error occured"
-            )
+            message = "Unknown error occured"
+        self._show_error("Gas Flow Regulator Error", message)
+
+    def _create_status_bar(self):
+        self._telemetry = None  # Last (status, temperature) shown
+        self._telemetry_label = QtWidgets.QLabel(self)
+        self.statusBar().addPermanentWidget(self._telemetry_label)
+
+        self._error_count = 0
+        self._error_count_label = QtWidgets.QLabel(self)
+        self.statusBar().addPermanentWidget(self._error_count_label)
+
+        # One non-modal dialog is reused for every error, so polling and queued
+        # worker results keep being processed while it is open.
+        self._error_box = QMessageBox(
+            QMessageBox.Critical, "", "", QMessageBox.Ok, self
+        )
+        self._error_box.setModal(False)
+        self._last_error_ts = float("-inf")
+
+    def _show_error(self, title, message):
+        """
+        @brief Reports an error without blocking the event loop.
+        @details
+        Every error is counted in the status bar. The error dialog is shown at most
+        once per ERROR_DIALOG_MIN_INTERVAL_S; while it is open it shows the latest error.
+        """
+        self._error_count += 1
+        self._error_count_label.setText(f"Errors: {self._error_count}")
+        self.statusBar().showMessage(message)
+
+        now = time.monotonic()
+        if self._error_box.isVisible():
+            self._error_box.setWindowTitle(title)
+            self._error_box.setText(message)
+            return
+        if now - self._last_error_ts < ERROR_DIALOG_MIN_INTERVAL_S:
+            return
+
+        self._last_error_ts = now
+        self._error_box.setWindowTitle(title)
+        self._error_box.setText(message)
+        self._error_box.show()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+@file rrg_worker.py
+@brief Provides the RRGWorker class that performs RRG device I/O off the GUI thread.
+@details
+Every RRGController call ends up in a blocking MODBUS-RTU round-trip that may take up to
+the configured response timeout. The RRGWorker owns the controller and is meant to be
+moved to a dedicated QThread; the GUI talks to it only through queued signals, so a
+stalled device never freezes the Qt event loop.
+"""
+
+from PyQt5 import QtCore
+from src.rrg import RRGController
+
+
+class RRGWorker(QtCore.QObject):
+    """
+    @brief Executes RRGController operations in the thread the worker lives in.
+    @details
+    Each slot reports its result with a dedicated signal carrying the controller error code.
+    Whenever an operation fails, errorOccurred is emitted with the value of
+    RRGController.GetLastError() captured in the worker thread.
+    """
+
+    turnedOn = QtCore.pyqtSignal(int, str)  # (error code, port)
+    turnedOff = QtCore.pyqtSignal(int)  # (error code)
+    flowSet = QtCore.pyqtSignal(int, float, float)  # (error code, setpoint, flow read back)
+    flowReady = QtCore.pyqtSignal(int, float)  # (error code, flow)
+    telemetryReady = QtCore.pyqtSignal(int, float)  # (status flags, temperature in °C)
+    errorOccurred = QtCore.pyqtSignal(object)  # Result of RRGController.GetLastError()
+
+    def __init__(self, parent=None):
+        """
+        @brief Initializes an RRGWorker instance with a disconnected controller.
+        """
+        super().__init__(parent)
+        self.controller = RRGController()
+        self._timeout_tuned = False  # Set after the first successful poll of a connection
+        self._read_telemetry = False  # Poll with ReadTelemetry instead of GetFlow
+
+    @QtCore.pyqtSlot(str, int, int, int)
+    def turnOn(self, port: str, baudrate: int, slave_id: int, timeout: int):
+        """@brief Connects to the RRG device and emits turnedOn."""
+        err = self.controller.TurnOn(port, baudrate, slave_id, timeout)
+        self._timeout_tuned = False
+        self._read_telemetry = self.controller.SupportsTelemetry()
+        self._report_error(err)
+        self.turnedOn.emit(err, port)
+
+    @QtCore.pyqtSlot()
+    def turnOff(self):
+        """
+        @brief Disconnects from the RRG device and emits turnedOff.
+        @details
+        When already disconnected, turnedOff carries ERROR_RRG_NOT_CONNECTED and no error
+        is reported.
+        """
+        if self.controller.IsDisconnected():
+            self.turnedOff.emit(self.controller.ERROR_RRG_NOT_CONNECTED)
+            return
+
+        err = self.controller.TurnOff()
+        self._report_error(err)
+        self.turnedOff.emit(err)
+
+    @QtCore.pyqtSlot(float)
+    def setFlow(self, setpoint: float):
+        """
+        @brief Sends a new flow setpoint, reads the flow back and emits flowSet.
+        @details
+        Uses RRGController.SetAndGetFlow, so the flow measured right after the write
+        comes with the same request instead of waiting for the next poll.
+        """
+        err, flow = self.controller.SetAndGetFlow(setpoint)
+        self._report_error(err)
+        self.flowSet.emit(err, setpoint, flow)
+
+    @QtCore.pyqtSlot()
+    def pollFlow(self):
+        """
+        @brief Reads the current flow and emits flowReady.
+        @details
+        flowReady is emitted for every request, so the GUI can tell when the poll is over.
+        When disconnected it carries ERROR_RRG_NOT_CONNECTED and no error is reported.
+        If the library supports it, the flow comes with the status flags and temperature
+        in a single ReadTelemetry request, and telemetryReady is emitted before flowReady.
+        Once the device has answered a poll, the response timeout is shortened to what
+        the responses need, so a lost frame does not stall the worker for the full
+        configured timeout. A failed poll carries an error code and does not count.
+        """
+        if self.controller.IsDisconnected():
+            self.flowReady.emit(self.controller.ERROR_RRG_NOT_CONNECTED, -1.0)
+            return
+
+        if self._read_telemetry:
+            err, _, status, temperature, flow = self.controller.ReadTelemetry()
+            if err == self.controller.RRG_OK:
+                self.telemetryReady.emit(status, temperature)
+        else:
+            err, flow = self.controller.GetFlow()
+        self._report_error(err)
+        if err == self.controller.RRG_OK and not self._timeout_tuned:
+            self._timeout_tuned = True
+            self.controller.TuneResponseTimeout()
+        self.flowReady.emit(err, flow)
+
+    @QtCore.pyqtSlot()
+    def shutdown(self):
+        """
+        @brief Closes the RRG connection, if any, without reporting results.
+        @details
+        Intended to be connected to QThread.finished so the device is released in the
+        worker thread when the application exits.
+        """
+        if self.controller.IsConnected():
+            self.controller.TurnOff()
+
+    def _report_error(self, err: int):
+        if err != self.controller.RRG_OK:
+            self.errorOccurred.emit(self.controller.GetLastError())
@@ -6,18 +6,27 @@ import sys
 import signal
 import traceback
 import datetime
-from PyQt5 import QtWidgets
+import logging
+import logging.handlers
+from PyQt5 import QtWidgets, QtCore
 from gui import RRGControlWindow
 
+# Epoch seconds instead of %(asctime)s, so records are not run through time.strftime().
+LOG_FORMAT = "%(created).3f %(levelname)s %(name)s: %(message)s"
+LOG_BUFFER_CAPACITY = 100
+LOG_FLUSH_INTERVAL_MS = 1000
+
 
 def sigint_handler(signum, frame):
     """
     @brief Signal handler for SIGINT (Ctrl+C).
     @details
-    This handler is invoked when the user presses Ctrl+C. It performs a graceful shutdown.
+    This handler is invoked when the user presses Ctrl+C. It performs a graceful shutdown:
+    the event loop is left normally, so the window releases the devices and stops the RRG
+    worker thread on QApplication.aboutToQuit.
     """
     print("\nCtrl+C detected. Quitting...")
-    sys.exit(0)
+    QtWidgets.QApplication.quit()
 
 
 def _check_qt_plugin_path():
@@ -36,18 +45,34 @@ def _check_qt_plugin_path():
             sys.exit(1)
 
 
+def _configure_logging():
+    """
+    @brief Configures application-wide logging.
+    @details
+    Records of level WARNING and above are written to stderr through a MemoryHandler that
+    batches them: the buffer is written out when it is full, as soon as an ERROR record
+    arrives, and whenever flush() is called.
+    @return The MemoryHandler, so the caller can flush it periodically.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    memory_handler = logging.handlers.MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=stream_handler
+    )
+    logging.basicConfig(level=logging.WARNING, handlers=[memory_handler])
+    return memory_handler
+
+
 def is_admin():
     """
     @brief Check if the script is running with administrative privileges.
     @return True if running as admin, False otherwise.
     """
     if os.name == "nt":  # Windows
-        try:
-            # Only administrators can access the C:\Windows\System32\config directory
-            os.listdir(os.path.join(os.environ["SystemRoot"], "System32", "config"))
-            return True
-        except PermissionError:
-            return False
+        import ctypes
+
+        # Ask the shell whether the current process token belongs to an administrator
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
     else:  # Linux/macOS
         return os.geteuid() == 0
 
@@ -85,7 +110,14 @@ def main():
     """
     # Install the SIGINT handler for Ctrl+C.
     signal.signal(signal.SIGINT, sigint_handler)
+    log_handler = _configure_logging()
     app = QtWidgets.QApplication(sys.argv)
+
+    # Write buffered log records out at least once per LOG_FLUSH_INTERVAL_MS.
+    log_flush_timer = QtCore.QTimer(app)
+    log_flush_timer.timeout.connect(log_handler.flush)
+    log_flush_timer.start(LOG_FLUSH_INTERVAL_MS)
+
     window = RRGControlWindow()
     window.show()
     sys.exit(app.exec_())
@@ -1,5 +1,50 @@
-import yaml
-import yaml.scanner
+import os
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# PyYAML and the selected loader class, imported on the first load_config() call
+# so that importing this module stays cheap.
+_yaml = None
+_LOADER = None
+
+# Process-level cache of parsed configuration files, keyed by absolute path.
+# Each entry is (mtime in ns, size in bytes, frozen configuration), so a file
+# holds at most one parsed copy.
+_config_cache = {}
+
+
+def _import_yaml():
+    """
+    Imports PyYAML on first use and selects the safe loader class.
+
+    :return: module
+        The yaml module. The libyaml-backed CSafeLoader is stored in _LOADER
+        when available; otherwise the pure-Python SafeLoader is used.
+    """
+    global _yaml, _LOADER
+    if _yaml is None:
+        import yaml
+
+        _LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _yaml = yaml
+    return _yaml
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively converts parsed YAML data into an immutable structure.
+
+    :param value: Any
+        A value produced by the YAML loader.
+    :return: Any
+        Dictionaries become read-only MappingProxyType views and lists
+        become tuples; scalars are returned unchanged.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
 class ConfigLoaderException(Exception):
@@ -84,41 +129,67 @@ class ConfigLoader:
     A utility class to load and parse YAML configuration files.
 
     This class provides a static method to load YAML files and ensures
-    proper error handling for missing files and invalid formats.
+    proper error handling for missing files and invalid formats. Parsed
+    files are cached for the lifetime of the process and re-read only
+    when their modification time or size changes. The returned
+    configurations are read-only, so cached results are shared without
+    copying.
     """
 
     @staticmethod
-    def load_config(file_path: str) -> dict:
+    def load_config(file_path: str) -> Mapping:
         """
         Loads a YAML configuration file.
 
         :param file_path: str
             Path to the YAML file.
-        :return: dict
-            The configuration data as a dictionary.
+        :return: Mapping
+            The configuration data as a read-only mapping. Nested mappings
+            are read-only as well and lists are returned as tuples; use
+            dict(...) to obtain a mutable copy.
         :raises ConfigFileNotFoundError: If the file does not exist.
         :raises ConfigFileFormatError: If the YAML format is invalid.
         :raises ConfigLoaderException: For unexpected errors during file loading.
 
         Algorithm:
-        1. Attempt to open the specified file.
-        2. Parse the file using yaml.safe_load().
-        3. Return the parsed configuration as a dictionary.
+        1. Check that the path refers to an existing regular file.
+        2. Import PyYAML and select the safe loader on the first call.
+        3. Get the modification time and size with a single os.stat() call.
+        4. Return the configuration cached for the absolute path if its
+           modification time and size are unchanged.
+        5. Otherwise, read the specified file as bytes in one call and parse it
+           with the safe loader (CSafeLoader when available).
+        6. Freeze the parsed configuration, replace the path's cache entry with
+           it and return it.
 
         Edge Cases:
-        - Missing file raises ConfigFileNotFoundError
+        - Missing file (or a path that is not a regular file) raises
+          ConfigFileNotFoundError without entering the exception handlers below
           (inside: Algorithm p. 1).
         - Invalid YAML syntax raises ConfigFileFormatError
-          (inside: Algorithm p. 2).
-        - Any unexpected exceptions are raised as ConfigLoaderException
-          (inside: Algorithm p. 3).
+          (inside: Algorithm p. 5).
+        - Any unexpected exceptions, including the file disappearing after the
+          check, are raised as ConfigLoaderException
+          (inside: Algorithm p. 3-6).
+        - The result is immutable, so one cached object can be shared by
+          all callers without copying.
         """
-        try:
-            with open(file_path, "r") as file:
-                return yaml.safe_load(file)
-        except FileNotFoundError:
+        abs_path = os.path.abspath(file_path)
+        if not os.path.isfile(abs_path):
             raise ConfigFileNotFoundError(file_path)
-        except (yaml.YAMLError, yaml.scanner.ScannerError) as e:
+
+        yaml = _import_yaml()
+        try:
+            stat = os.stat(abs_path)
+            cached = _config_cache.get(abs_path)
+            if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+            with open(abs_path, "rb") as file:
+                data = file.read()
+            config = _freeze(yaml.load(data, _LOADER))
+            _config_cache[abs_path] = (stat.st_mtime_ns, stat.st_size, config)
+            return config
+        except yaml.YAMLError as e:
             raise ConfigFileFormatError(file_path, e)
         except Exception as e:
             raise ConfigLoaderException(
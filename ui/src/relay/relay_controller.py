@@ -42,6 +42,7 @@ class RelayController:
         to establish a connection to the Relay device.
         """
         self._relay = None  # Will hold an instance of Relay after connection
+        self._relay_instance = None  # Last created Relay, reused on reconnect
 
     def TurnOn(self, com_port: str, baudrate: int, slave_id: int, timeout: int) -> int:
         """
@@ -53,10 +54,15 @@ class RelayController:
         @return RELAY_OK on success, or an error code if connection or operation fails.
         """
         try:
-            self._relay = Relay(com_port, baudrate, slave_id, timeout)
-            if not self._relay.connect():
+            if self._relay_instance is None:
+                self._relay_instance = Relay(com_port, baudrate, slave_id, timeout)
+                connected = self._relay_instance.connect()
+            else:
+                connected = self._relay_instance.reconnect(com_port, baudrate, slave_id, timeout)
+            if not connected:
                 self._relay = None
                 return self.ERROR_RELAY_CONNECT_FAILED
+            self._relay = self._relay_instance
             if self._relay.turn_on():
                 return self.RELAY_OK
             else:
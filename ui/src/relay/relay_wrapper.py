@@ -3,7 +3,7 @@
 @file relay_wrapper.py
 @brief Python wrapper for the Relay C API.
 @details
-This module loads the Relay shared library and exposes a Python interface to the
+This module loads the Relay shared library on first use and exposes a Python interface to the
 functions defined in the Relay C API. It defines:
   - RelayConfig: A ctypes Structure mapping to the C Relay_Config struct.
   - RelayHandle: A ctypes Structure mapping to the C Relay_Handle struct.
@@ -12,16 +12,16 @@ functions defined in the Relay C API. It defines:
 """
 
 import os
-import sys
+import pathlib
 import ctypes
 import logging
 from ctypes import CDLL, POINTER, c_char_p, c_int, c_void_p
 
 
-# Configure logging.
-logging.basicConfig(level=logging.DEBUG,
-                    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+# Logging is configured by the application; set RELAY_DEBUG to get debug records from here.
 logger = logging.getLogger(__name__)
+if os.environ.get("RELAY_DEBUG"):
+    logger.setLevel(logging.DEBUG)
 
 # Determine the Relay library filename based on the platform.
 if os.name == "nt":
@@ -30,19 +30,13 @@ else:
     lib_filename = "librelay.so"
 
 # Build the path relative to the current file's directory.
-# Assuming this file is in ui/relay/relay_wrapper.py, the shared library is in "../resources/"
-current_dir = os.path.dirname(os.path.abspath(__file__))
-lib_path = os.path.join(current_dir, "../..", "resources", lib_filename)
-lib_path = os.path.abspath(lib_path)
+# This file is in ui/src/relay/relay_wrapper.py, the shared library is in ui/resources/
+resources_dir = pathlib.Path(__file__).resolve().parents[2] / "resources"
+lib_path = str(resources_dir / lib_filename)
 
-logger.info("Loading shared library from: %s", lib_path)
-
-# Load the shared library.
-try:
-    relay_lib = CDLL(lib_path)
-except OSError as e:
-    logger.error("Failed to load shared library: %s", e)
-    sys.exit(f"Failed to load shared library: {e}")
+# The shared library is loaded on first use (see _ensure_loaded), so importing this
+# module does not require the native library to be present.
+relay_lib = None
 
 
 class RelayConfig(ctypes.Structure):
@@ -68,6 +62,62 @@ class RelayHandle(ctypes.Structure):
     ]
 
 
+def _bind_signatures(lib: CDLL) -> None:
+    """
+    @brief Configures the ctypes function signatures for the Relay API.
+    @param lib The loaded Relay shared library.
+    @throws AttributeError If the library is missing a Relay API function.
+    """
+    lib.RELAY_Init.argtypes = [POINTER(RelayConfig), POINTER(RelayHandle)]
+    lib.RELAY_Init.restype = c_int
+
+    lib.RELAY_TurnOn.argtypes = [POINTER(RelayHandle)]
+    lib.RELAY_TurnOn.restype = c_int
+
+    lib.RELAY_TurnOff.argtypes = [POINTER(RelayHandle)]
+    lib.RELAY_TurnOff.restype = c_int
+
+    lib.RELAY_Close.argtypes = [POINTER(RelayHandle)]
+    lib.RELAY_Close.restype = None
+
+    # Returned as a raw address: the messages are static C strings, so an unchanged
+    # address means an unchanged message (see Relay.get_last_error).
+    lib.RELAY_GetLastError.restype = c_void_p
+
+
+def _ensure_loaded() -> None:
+    """
+    @brief Loads the Relay shared library and binds its signatures on first call.
+    @details
+    Subsequent calls return immediately. Assigning a stand-in object to relay_lib
+    beforehand skips loading entirely. On failure relay_lib stays unset, so the next
+    call tries again.
+    @throws OSError If the shared library cannot be loaded.
+    @throws ImportError If the shared library is missing a Relay API function.
+    """
+    global relay_lib, _dll_directory
+    if relay_lib is not None:
+        return
+
+    # Let the loader resolve the library's own DLL dependencies from the resources directory.
+    if os.name == "nt":
+        _dll_directory = os.add_dll_directory(str(resources_dir))
+
+    logger.info("Loading shared library from: %s", lib_path)
+    try:
+        lib = CDLL(lib_path)
+    except OSError as e:
+        logger.error("Failed to load shared library: %s", e)
+        raise
+
+    try:
+        _bind_signatures(lib)
+    except AttributeError as e:
+        logger.error("Shared library is missing a Relay API function: %s", e)
+        raise ImportError(f"Shared library is missing a Relay API function: {e}") from e
+    relay_lib = lib
+
+
 class IRelay:
     """
     @brief Interface defining methods for interacting with the Relay device.
@@ -119,31 +169,20 @@ class Relay(IRelay):
         @param baudrate Baud rate for communication.
         @param slave_id MODBUS slave ID.
         @param timeout Response timeout in milliseconds.
+        @throws OSError If the Relay shared library cannot be loaded.
+        @throws ImportError If the Relay shared library is incomplete.
         """
+        _ensure_loaded()
         logger.debug("Initializing Relay with port=%s, baudrate=%d, slave_id=%d, timeout=%d",
                      port, baudrate, slave_id, timeout)
         self._config = RelayConfig(port.encode("utf-8"), baudrate, slave_id, timeout)
         self._handle = RelayHandle()
-        self._setup_functions()
-
-    def _setup_functions(self) -> None:
-        """
-        @brief Configures the ctypes function signatures for the Relay API.
-        """
-        logger.debug("Setting up function signatures for the Relay API.")
-        relay_lib.RELAY_Init.argtypes = [POINTER(RelayConfig), POINTER(RelayHandle)]
-        relay_lib.RELAY_Init.restype = c_int
-
-        relay_lib.RELAY_TurnOn.argtypes = [POINTER(RelayHandle)]
-        relay_lib.RELAY_TurnOn.restype = c_int
-
-        relay_lib.RELAY_TurnOff.argtypes = [POINTER(RelayHandle)]
-        relay_lib.RELAY_TurnOff.restype = c_int
-
-        relay_lib.RELAY_Close.argtypes = [POINTER(RelayHandle)]
-        relay_lib.RELAY_Close.restype = None
-
-        relay_lib.RELAY_GetLastError.restype = c_char_p
+        # Pointers passed to every C call; created once instead of per call.
+        self._config_ptr = ctypes.pointer(self._config)
+        self._handle_ptr = ctypes.pointer(self._handle)
+        # Last RELAY_GetLastError() address and its decoded message.
+        self._last_err_ptr_addr = None
+        self._last_err_str = None
 
     def connect(self) -> bool:
         """
@@ -153,24 +192,44 @@ class Relay(IRelay):
         logger.info("Attempting to initialize Relay device with config: port=%s, baudrate=%d, slave_id=%d, timeout=%d",
                     self._config.port.decode('utf-8') if self._config.port else "None",
                     self._config.baudrate, self._config.slave_id, self._config.timeout)
-        result = relay_lib.RELAY_Init(ctypes.byref(self._config), ctypes.byref(self._handle))
-        error_message = self.get_last_error()
-        if error_message and error_message != "No error.":
-            logger.warning("RELAY_GetLastError returned: %s", error_message)
-        logger.info("Relay device initialized successfully (result=%d).", result)
+        result = relay_lib.RELAY_Init(self._config_ptr, self._handle_ptr)
+        if result != 0:
+            logger.error("Failed to initialize Relay device (result=%d). Error: %s",
+                         result, self.get_last_error())
+        else:
+            logger.info("Relay device initialized successfully.")
         return result == 0
 
+    def reconnect(self, port: str, baudrate: int, slave_id: int, timeout: int) -> bool:
+        """
+        @brief Re-establishes the connection with new parameters, reusing this instance.
+        @details
+        The existing config and handle structures are updated in place instead of being
+        reallocated, any open connection is closed, and RELAY_Init is called again.
+        @param port Serial port name (e.g., "COM3" or "/dev/ttyUSB0").
+        @param baudrate Baud rate for communication.
+        @param slave_id MODBUS slave ID.
+        @param timeout Response timeout in milliseconds.
+        @return True if the connection is successfully established, False otherwise.
+        """
+        if self._handle.modbus_ctx:
+            self.close()
+        self._config.port = port.encode("utf-8")
+        self._config.baudrate = baudrate
+        self._config.slave_id = slave_id
+        self._config.timeout = timeout
+        return self.connect()
+
     def turn_on(self) -> bool:
         """
         @brief Turns on the relay.
         @return True if the relay is successfully turned on, otherwise False.
         """
-        logger.info("Turning relay ON.")
-        result = relay_lib.RELAY_TurnOn(ctypes.byref(self._handle))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Turning relay ON.")
+        result = relay_lib.RELAY_TurnOn(self._handle_ptr)
         if result != 0:
             logger.error("Failed to turn relay ON. Error: %s", self.get_last_error())
-        else:
-            logger.info("Relay turned ON successfully.")
         return result == 0
 
     def turn_off(self) -> bool:
@@ -178,12 +237,11 @@ class Relay(IRelay):
         @brief Turns off the relay.
         @return True if the relay is successfully turned off, otherwise False.
         """
-        logger.info("Turning relay OFF.")
-        result = relay_lib.RELAY_TurnOff(ctypes.byref(self._handle))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Turning relay OFF.")
+        result = relay_lib.RELAY_TurnOff(self._handle_ptr)
         if result != 0:
             logger.error("Failed to turn relay OFF. Error: %s", self.get_last_error())
-        else:
-            logger.info("Relay turned OFF successfully.")
         return result == 0
 
     def close(self) -> None:
@@ -192,7 +250,7 @@ class Relay(IRelay):
         """
         if self._handle and self._handle.modbus_ctx:
             logger.info("Closing connection to Relay device.")
-            relay_lib.RELAY_Close(ctypes.byref(self._handle))
+            relay_lib.RELAY_Close(self._handle_ptr)
             self._handle.modbus_ctx = None
             logger.info("Connection closed successfully.")
         else:
@@ -204,6 +262,11 @@ class Relay(IRelay):
         @return A string containing the error message.
         """
         err_ptr = relay_lib.RELAY_GetLastError()
-        error_str = err_ptr.decode("utf-8") if err_ptr else "Unknown error."
-        logger.debug("Retrieved last error: %s", error_str)
+        if err_ptr != self._last_err_ptr_addr:
+            self._last_err_ptr_addr = err_ptr
+            self._last_err_str = (ctypes.cast(err_ptr, c_char_p).value.decode("utf-8")
+                                  if err_ptr else "Unknown error.")
+        error_str = self._last_err_str
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved last error: %s", error_str)
         return error_str
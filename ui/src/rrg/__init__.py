@@ -1,6 +1,6 @@
 # ПНППК/src/rrg/__init__.py
 
-from .rrg_controller import RRGController
-from .rrg_wrapper import RRG
+# RRG is the binding selected by rrg_controller, so only one of them loads the library.
+from .rrg_controller import RRGController, RRG
 
 __all__ = ["RRGController", "RRG"]
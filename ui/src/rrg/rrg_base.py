@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+@file rrg_base.py
+@brief Backend-independent part of the RRG Python bindings.
+@details
+This module does not load the RRG shared library, so the ctypes and CFFI bindings can both
+build on it. It defines:
+  - The library path and the MODBUS register/response constants.
+  - LazyMessage, decode_flow(), decode_temperature() and response_timeout_us() helpers.
+  - IRRG: The RRG interface, implemented on top of a few library calls provided by
+    each binding (see rrg_wrapper.RRG and rrg_cffi.CffiRRG).
+"""
+
+import os
+import pathlib
+import logging
+
+# Logging is configured by the application; set RRG_DEBUG to get debug records from here.
+logger = logging.getLogger(__name__)
+if os.environ.get("RRG_DEBUG"):
+    logger.setLevel(logging.DEBUG)
+
+# Determine the library filename based on the platform.
+if os.name == "nt":
+    lib_filename = "rrg.dll"
+else:
+    lib_filename = "librrg.so"
+
+# Build the path relative to the current file's directory.
+# This file is in ui/src/rrg/rrg_base.py, the shared library is in ui/resources/
+resources_dir = pathlib.Path(__file__).resolve().parents[2] / "resources"
+lib_path = str(resources_dir / lib_filename)
+
+# Telemetry block fetched by IRRG.read_block() with a single MODBUS request:
+# gas type (register 2100), status flags (2101), temperature (2102) and the current
+# flow (2103-2104).
+TELEMETRY_START_REGISTER = 2100
+TELEMETRY_REGISTER_COUNT = 5
+TELEMETRY_GAS_OFFSET = 0
+TELEMETRY_STATUS_OFFSET = 1
+TELEMETRY_TEMPERATURE_OFFSET = 2
+TELEMETRY_FLOW_OFFSET = 3
+
+# Status flags in register 2101, with the abbreviations used by the device manual.
+STATUS_MASS_FLOW_OVERRANGE = 0x01     # MOV
+STATUS_TEMPERATURE_OVERRANGE = 0x02   # TOV
+STATUS_TOTALIZER_OVERRANGE = 0x04     # OVR
+STATUS_VALVE_FROZEN = 0x08            # HLD, valve frozen by the user
+STATUS_VALVE_THERMAL_MANAGEMENT = 0x10  # VTM
+STATUS_FLAG_NAMES = (
+    (STATUS_MASS_FLOW_OVERRANGE, "MOV"),
+    (STATUS_TEMPERATURE_OVERRANGE, "TOV"),
+    (STATUS_TOTALIZER_OVERRANGE, "OVR"),
+    (STATUS_VALVE_FROZEN, "HLD"),
+    (STATUS_VALVE_THERMAL_MANAGEMENT, "VTM"),
+)
+
+# Expected MODBUS-RTU response sizes in bytes (slave ID, function code, payload, CRC).
+WRITE_RESPONSE_BYTES = 8                                 # Function codes 6 and 16 echo the request.
+FLOW_RESPONSE_BYTES = 5 + 2 * 2                          # Function code 3, two registers.
+TELEMETRY_RESPONSE_BYTES = 5 + 2 * TELEMETRY_REGISTER_COUNT
+RTU_BITS_PER_CHAR = 11                                   # Start bit, 8 data bits, parity/stop bits.
+RESPONSE_TIMEOUT_MARGIN_MS = 20                          # Device turnaround allowance.
+LONGEST_RESPONSE_BYTES = max(WRITE_RESPONSE_BYTES, FLOW_RESPONSE_BYTES, TELEMETRY_RESPONSE_BYTES)
+
+
+def response_timeout_us(response_bytes: int, baudrate: int, limit_ms: int) -> int:
+    """
+    @brief Computes a response timeout sized to the expected response frame.
+    @param response_bytes Length of the expected response in bytes.
+    @param baudrate Baud rate of the serial line.
+    @param limit_ms Upper bound in milliseconds, normally the configured timeout.
+    @return RESPONSE_TIMEOUT_MARGIN_MS plus the frame transmission time, capped at
+    limit_ms, in microseconds.
+    """
+    wire_us = response_bytes * RTU_BITS_PER_CHAR * 1_000_000 // baudrate
+    return min(RESPONSE_TIMEOUT_MARGIN_MS * 1000 + wire_us, limit_ms * 1000)
+
+
+class LazyMessage:
+    """
+    @brief Log argument that produces its text only when the record is formatted.
+    @details
+    Passed as a `%s` argument so that, for instance, the library's last error is only
+    fetched and decoded if the log record is actually emitted.
+    """
+    __slots__ = ("_func",)
+
+    def __init__(self, func) -> None:
+        """
+        @brief Initializes a LazyMessage instance.
+        @param func Callable without arguments that returns the message text.
+        """
+        self._func = func
+
+    def __str__(self) -> str:
+        return self._func()
+
+
+def decode_flow(high: int, low: int) -> float:
+    """
+    @brief Converts the two flow registers into SCCM, the same way RRG_GetFlow does.
+    @param high Value of the first (high) flow register.
+    @param low Value of the second (low) flow register.
+    @return The flow rate in SCCM.
+    """
+    return ((high << 16) | low) / 1000.0
+
+
+def decode_temperature(value: int) -> float:
+    """
+    @brief Converts the temperature register into degrees Celsius.
+    @param value Value of the temperature register, a signed 16-bit integer.
+    @return The temperature in °C.
+    """
+    if value & 0x8000:
+        value -= 0x10000
+    return value / 100.0
+
+
+class IRRG:
+    """
+    @brief Interface defining methods for interacting with the RRG device.
+    @details
+    The operations are implemented here once. A binding only provides the library calls:
+    it sets the `_c_*` attributes to the library functions with the handle already bound,
+    allocates the `_flow_out` (one float) and `_block` (TELEMETRY_REGISTER_COUNT uint16)
+    output buffers, and implements _c_init(), _c_close() and is_connected().
+
+    Implementations can be used as context managers: the connection is opened on entering
+    the with block and closed on leaving it. An open connection is also closed when the
+    object is garbage collected, so the serial port is never left locked.
+    """
+
+    # Library calls bound by the binding. The optional ones stay None if the loaded
+    # library does not provide them.
+    _c_set_flow = None                # (setpoint) -> int
+    _c_get_flow = None                # (flow_out) -> int
+    _c_set_gas = None                 # (gas_id) -> int
+    _c_set_and_get_flow = None        # (setpoint, flow_out) -> int, optional
+    _c_read_registers = None          # (start, count, dest) -> int, optional
+    _c_set_response_timeout = None    # (sec, usec) -> int, optional
+
+    # LazyMessage with the library's last error, set by the binding.
+    _last_error = None
+
+    def __init__(self, port: str, baudrate: int, slave_id: int, timeout: int) -> None:
+        """
+        @brief Stores the connection parameters shared by all bindings.
+        @param port Serial port name (e.g., "COM3" or "/dev/ttyUSB0").
+        @param baudrate Baud rate for communication.
+        @param slave_id MODBUS slave ID.
+        @param timeout Response timeout in milliseconds.
+        """
+        logger.debug("Initializing RRG with port=%s, baudrate=%d, slave_id=%d, timeout=%d",
+                     port, baudrate, slave_id, timeout)
+        self._port = port
+        self._baudrate = baudrate
+        self._slave_id = slave_id
+        self._timeout = timeout
+        # Checked once: the success messages below are skipped entirely when INFO is off.
+        self._log_info = logger.isEnabledFor(logging.INFO)
+        # Response timeout currently set in the library (see tune_response_timeout()).
+        self._timeout_us = timeout * 1000
+
+    def __enter__(self):
+        """
+        @brief Connects to the RRG device.
+        @return This instance.
+        @throws ConnectionError If the connection cannot be established.
+        """
+        if not self.connect():
+            raise ConnectionError(f"Failed to connect to the RRG device: {self.get_last_error()}")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        @brief Closes the connection, if it is still open.
+        """
+        if self.is_connected():
+            self.close()
+
+    def __del__(self) -> None:
+        """
+        @brief Closes a connection that was never closed explicitly.
+        """
+        try:
+            if self.is_connected():
+                self.close()
+        except Exception:
+            pass
+
+    def _c_init(self) -> int:
+        """
+        @brief Calls RRG_Init, clearing the handle again if it fails.
+        @return The RRG_Init result, 0 on success.
+        """
+        raise NotImplementedError
+
+    def _c_close(self) -> None:
+        """
+        @brief Calls RRG_Close and clears the handle.
+        """
+        raise NotImplementedError
+
+    def is_connected(self) -> bool:
+        """
+        @brief Checks whether the connection to the RRG device is open.
+        @return True if connected, otherwise False.
+        """
+        raise NotImplementedError
+
+    def connect(self) -> bool:
+        """
+        @brief Establishes a connection with the RRG device.
+        @return True if the connection is successfully established, False otherwise.
+        """
+        logger.info("Attempting to initialize RRG device with config: port=%s, baudrate=%d, slave_id=%d, timeout=%d",
+                    self._port, self._baudrate, self._slave_id, self._timeout)
+        result = self._c_init()
+        if result != 0:
+            logger.error("Failed to initialize RRG device (result=%d). Error: %s", result, self._last_error)
+        else:
+            logger.info("RRG device initialized successfully.")
+        return result == 0
+
+    def set_flow(self, setpoint: float) -> bool:
+        """
+        @brief Sends a new flow setpoint to the RRG device.
+        @param setpoint Desired flow rate in SCCM.
+        @return True if the setpoint is successfully sent, False otherwise.
+        """
+        result = self._c_set_flow(setpoint)
+        if result != 0:
+            logger.error("Failed to set flow to %.3f SCCM. Error: %s", setpoint, self._last_error)
+        elif self._log_info:
+            logger.info("Flow set successfully to %.3f SCCM.", setpoint)
+        return result == 0
+
+    def get_flow(self) -> float:
+        """
+        @brief Retrieves the current flow rate from the RRG device.
+        @return The current flow rate in SCCM, or -1.0 if an error occurs.
+        """
+        result = self._c_get_flow(self._flow_out)
+        if result != 0:
+            logger.error("Failed to retrieve flow (return code %d). Error: %s", result, self._last_error)
+            return -1.0
+        flow = self._flow_out[0]
+        if self._log_info:
+            logger.info("Retrieved flow: %.3f SCCM.", flow)
+        return flow
+
+    def set_and_get_flow(self, setpoint: float) -> float:
+        """
+        @brief Sends a new flow setpoint and reads back the current flow rate.
+        @details
+        Uses RRG_SetAndGetFlow, which writes the setpoint in one MODBUS request and reads
+        the flow right after it inside the library. Falls back to set_flow() followed by
+        get_flow() if the loaded library does not provide it.
+        @param setpoint Desired flow rate in SCCM.
+        @return The current flow rate in SCCM, or -1.0 if an error occurs.
+        """
+        if self._c_set_and_get_flow is None:
+            return self.get_flow() if self.set_flow(setpoint) else -1.0
+
+        result = self._c_set_and_get_flow(setpoint, self._flow_out)
+        if result != 0:
+            logger.error("Failed to set flow to %.3f SCCM and read it back. Error: %s",
+                         setpoint, self._last_error)
+            return -1.0
+        flow = self._flow_out[0]
+        if self._log_info:
+            logger.info("Flow set to %.3f SCCM, retrieved flow: %.3f SCCM.", setpoint, flow)
+        return flow
+
+    def supports_read_block(self) -> bool:
+        """
+        @brief Checks whether the loaded library provides RRG_ReadRegisters.
+        @return True if read_block() can be used, otherwise False.
+        """
+        return self._c_read_registers is not None
+
+    def read_block(self):
+        """
+        @brief Reads the telemetry block (gas type, status, temperature and current flow)
+        in one request.
+        @details
+        Fetches TELEMETRY_REGISTER_COUNT registers starting at TELEMETRY_START_REGISTER
+        with RRG_ReadRegisters and decodes them here.
+        @return A (gas_id, status, temperature, flow) tuple, where status is a combination
+        of the STATUS_* flags and temperature is in °C, or None if an error occurs or the
+        loaded library does not provide RRG_ReadRegisters.
+        """
+        if self._c_read_registers is None:
+            logger.error("The loaded RRG library does not provide RRG_ReadRegisters.")
+            return None
+
+        block = self._block
+        result = self._c_read_registers(TELEMETRY_START_REGISTER, TELEMETRY_REGISTER_COUNT, block)
+        if result != 0:
+            logger.error("Failed to read telemetry registers. Error: %s", self._last_error)
+            return None
+        return (block[TELEMETRY_GAS_OFFSET],
+                block[TELEMETRY_STATUS_OFFSET],
+                decode_temperature(block[TELEMETRY_TEMPERATURE_OFFSET]),
+                decode_flow(block[TELEMETRY_FLOW_OFFSET], block[TELEMETRY_FLOW_OFFSET + 1]))
+
+    def tune_response_timeout(self) -> bool:
+        """
+        @brief Switches to a response timeout sized to the expected responses.
+        @details
+        Until this is called every request waits up to the timeout given at construction.
+        Afterwards it waits RESPONSE_TIMEOUT_MARGIN_MS plus the transmission time of the
+        longest expected response, capped at that timeout, so a lost frame is detected
+        early. One timeout serves every request, so it is set in the library once instead
+        of on every switch between requests. Meant to be called once the device has
+        answered at least once.
+        @return True if the timeout was tuned, False if the loaded library does not
+        provide RRG_SetResponseTimeout or rejects the timeout.
+        """
+        if self._c_set_response_timeout is None:
+            return False
+
+        timeout_us = response_timeout_us(LONGEST_RESPONSE_BYTES, self._baudrate, self._timeout)
+        if timeout_us == self._timeout_us:
+            return True
+        if self._c_set_response_timeout(timeout_us // 1_000_000, timeout_us % 1_000_000) != 0:
+            logger.error("Failed to set response timeout to %d us. Error: %s",
+                         timeout_us, self._last_error)
+            return False
+        self._timeout_us = timeout_us
+        if self._log_info:
+            logger.info("Response timeout tuned to %d us.", timeout_us)
+        return True
+
+    def set_gas(self, gas_id: int) -> bool:
+        """
+        @brief Sets the gas type in the RRG device.
+        @param gas_id Gas type identifier (e.g., 7 for Helium).
+        @return True if the gas type is successfully set, False otherwise.
+        """
+        result = self._c_set_gas(gas_id)
+        if result != 0:
+            logger.error("Failed to set gas to ID %d. Error: %s", gas_id, self._last_error)
+        elif self._log_info:
+            logger.info("Gas set successfully to ID %d.", gas_id)
+        return result == 0
+
+    def close(self) -> None:
+        """
+        @brief Closes the connection to the RRG device and frees resources.
+        """
+        if self.is_connected():
+            logger.info("Closing connection to RRG device.")
+            self._c_close()
+            logger.info("Connection closed successfully.")
+        else:
+            logger.warning("Attempted to close RRG device, but handle is invalid or already closed.")
+
+    def get_last_error(self) -> str:
+        """
+        @brief Retrieves the description of the last occurred error.
+        @return A string containing the error message.
+        """
+        error_str = str(self._last_error)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved last error: %s", error_str)
+        return error_str
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+@file rrg_cffi.py
+@brief CFFI binding for the RRG C API.
+@details
+This module is an optional alternative to the ctypes-based RRG class from rrg_wrapper. It
+opens the same shared library through CFFI in ABI mode, so a call into the library does
+not go through the libffi argument marshalling ctypes performs on every call. It defines:
+  - CffiRRG: A CFFI implementation of IRRG (see rrg_base) with the same interface as
+    rrg_wrapper.RRG.
+The binding is opt-in (see rrg_controller). Importing this module raises ImportError if
+the cffi package is not installed and OSError if the library cannot be loaded.
+"""
+
+import os
+import logging
+from functools import partial
+from cffi import FFI
+
+from src.rrg.rrg_base import IRRG, LazyMessage, lib_path, resources_dir, TELEMETRY_REGISTER_COUNT
+
+# Logging is configured by the application; set RRG_DEBUG to get debug records from here.
+logger = logging.getLogger(__name__)
+if os.environ.get("RRG_DEBUG"):
+    logger.setLevel(logging.DEBUG)
+
+ffi = FFI()
+ffi.cdef("""
+    typedef struct
+    {
+        char *port;
+        int baudrate;
+        int slave_id;
+        int timeout;
+    } RRG_Config;
+
+    typedef struct
+    {
+        void *modbus_ctx;
+    } RRG_Handle;
+
+    int RRG_Init(const RRG_Config *config, RRG_Handle *handle);
+    int RRG_SetFlow(RRG_Handle *handle, float setpoint);
+    int RRG_GetFlow(RRG_Handle *handle, float *flow);
+    int RRG_SetAndGetFlow(RRG_Handle *handle, float setpoint, float *flow);
+    int RRG_ReadRegisters(RRG_Handle *handle, int start, int count, uint16_t *dest);
+    int RRG_SetResponseTimeout(RRG_Handle *handle, uint32_t sec, uint32_t usec);
+    int RRG_SetGas(RRG_Handle *handle, int gas_id);
+    void RRG_Close(RRG_Handle *handle);
+    const char *RRG_GetLastError(void);
+""")
+
+# Let the loader resolve the library's own DLL dependencies from the resources directory.
+if os.name == "nt":
+    _dll_directory = os.add_dll_directory(str(resources_dir))
+
+logger.debug("Loading shared library through CFFI from: %s", lib_path)
+rrg_lib = ffi.dlopen(lib_path)
+
+
+def _optional_function(name: str):
+    """
+    @brief Looks up a library function added after the first library release.
+    @param name Name of the C function.
+    @return The function, or None if the loaded library does not provide it.
+    """
+    # Symbols are resolved lazily in ABI mode, so a missing one shows up on first access.
+    try:
+        return getattr(rrg_lib, name)
+    except AttributeError:
+        return None
+
+
+_c_set_and_get_flow = _optional_function("RRG_SetAndGetFlow")
+_c_read_registers = _optional_function("RRG_ReadRegisters")
+_c_set_response_timeout = _optional_function("RRG_SetResponseTimeout")
+
+
+def _read_last_error() -> str:
+    """
+    @brief Fetches and decodes the library's last error message.
+    @return A string containing the error message.
+    """
+    err_ptr = rrg_lib.RRG_GetLastError()
+    return ffi.string(err_ptr).decode("utf-8") if err_ptr != ffi.NULL else "Unknown error."
+
+
+# Shared by all instances: the library keeps a single, global last error.
+_LAST_ERROR = LazyMessage(_read_last_error)
+
+
+class CffiRRG(IRRG):
+    """
+    @brief CFFI-based wrapper for the RRG C API.
+    Drop-in replacement for rrg_wrapper.RRG.
+    """
+    _last_error = _LAST_ERROR
+
+    def __init__(self, port: str, baudrate: int, slave_id: int, timeout: int) -> None:
+        """
+        @brief Initializes a CffiRRG instance with the given connection parameters.
+        @details
+        The config, handle and output buffers are allocated once here and passed to the
+        library as-is on every call.
+        @param port Serial port name (e.g., "COM3" or "/dev/ttyUSB0").
+        @param baudrate Baud rate for communication.
+        @param slave_id MODBUS slave ID.
+        @param timeout Response timeout in milliseconds.
+        """
+        super().__init__(port, baudrate, slave_id, timeout)
+        # The config only stores a pointer, so the port buffer must outlive it.
+        self._port_buf = ffi.new("char[]", port.encode("utf-8"))
+        self._config = ffi.new("RRG_Config *", [self._port_buf, baudrate, slave_id, timeout])
+        self._handle = handle = ffi.new("RRG_Handle *")
+        self._flow_out = ffi.new("float[1]")
+        self._block = ffi.new("uint16_t[]", TELEMETRY_REGISTER_COUNT)
+        self._c_set_flow = partial(rrg_lib.RRG_SetFlow, handle)
+        self._c_get_flow = partial(rrg_lib.RRG_GetFlow, handle)
+        self._c_set_gas = partial(rrg_lib.RRG_SetGas, handle)
+        if _c_set_and_get_flow is not None:
+            self._c_set_and_get_flow = partial(_c_set_and_get_flow, handle)
+        if _c_read_registers is not None:
+            self._c_read_registers = partial(_c_read_registers, handle)
+        if _c_set_response_timeout is not None:
+            self._c_set_response_timeout = partial(_c_set_response_timeout, handle)
+
+    def _c_init(self) -> int:
+        """
+        @brief Calls RRG_Init, clearing the handle again if it fails.
+        @return The RRG_Init result, 0 on success.
+        """
+        result = rrg_lib.RRG_Init(self._config, self._handle)
+        if result != 0:
+            # Never keep a stale context pointer from a failed initialization.
+            self._handle.modbus_ctx = ffi.NULL
+        return result
+
+    def _c_close(self) -> None:
+        """
+        @brief Calls RRG_Close and clears the handle.
+        """
+        rrg_lib.RRG_Close(self._handle)
+        self._handle.modbus_ctx = ffi.NULL
+
+    def is_connected(self) -> bool:
+        """
+        @brief Checks whether the connection to the RRG device is open.
+        @return True if connected, otherwise False.
+        """
+        return self._handle.modbus_ctx != ffi.NULL
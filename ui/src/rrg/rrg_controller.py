@@ -11,7 +11,21 @@ Each method returns an error code (with 0 indicating success) so that calling co
 handle error conditions appropriately.
 """
 
-from src.rrg.rrg_wrapper import RRG
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# The ctypes binding is the default. RRG_BACKEND=cffi selects the CFFI binding instead,
+# which skips the per-call ctypes marshalling but needs the cffi package.
+if os.environ.get("RRG_BACKEND", "").lower() == "cffi":
+    try:
+        from src.rrg.rrg_cffi import CffiRRG as RRG
+    except (ImportError, OSError) as e:
+        logger.warning("CFFI binding unavailable (%s), using the ctypes binding.", e)
+        from src.rrg.rrg_wrapper import RRG
+else:
+    from src.rrg.rrg_wrapper import RRG
 
 
 class RRGController:
@@ -53,18 +67,24 @@ class RRGController:
         @param timeout Communication timeout in milliseconds.
         @return RRG_OK on success, or an error code if connection fails.
         """
+        # Release the previous connection instead of leaving it to the garbage collector.
+        if self._rrg is not None:
+            self.TurnOff()
+
+        rrg = None
         try:
-            self._rrg = RRG(com_port, baudrate, slave_id, timeout)
-            if self._rrg.connect():
+            rrg = RRG(com_port, baudrate, slave_id, timeout)
+            if rrg.connect():
+                self._rrg = rrg
                 return self.RRG_OK
-            else:
-                # Connection failed; ensure _rrg is set to None.
-                self._rrg = None
-                return self.ERROR_RRG_CONNECT_FAILED
+            return self.ERROR_RRG_CONNECT_FAILED
         except Exception:
             # Log exception details if needed.
-            self._rrg = None
             return self.ERROR_RRG_CONNECT_FAILED
+        finally:
+            # A failed attempt must not keep a port or a libmodbus context open.
+            if rrg is not None and self._rrg is not rrg and rrg.is_connected():
+                rrg.close()
 
     def TurnOff(self) -> int:
         """
@@ -104,15 +124,69 @@ class RRGController:
         @return A tuple (error_code, flow_value).
         """
         if self._rrg is None:
-            return (self.ERROR_RRG_NOT_CONNECTED, -1.0)
+            return _NOT_CONNECTED_RESULT
 
         try:
             flow = self._rrg.get_flow()
             if flow < 0:
-                return (self.RRG_OK, flow)
+                return _GET_FLOW_FAILED_RESULT
+            return (self.RRG_OK, flow)
+        except Exception:
+            return _GET_FLOW_FAILED_RESULT
+
+    def SetAndGetFlow(self, setpoint: float):
+        """
+        @brief Sends a new flow setpoint and reads back the current flow rate in one call.
+        @param setpoint The desired flow setpoint (e.g., in SCCM).
+        @return A tuple (error_code, flow_value).
+        """
+        if self._rrg is None:
+            return _NOT_CONNECTED_RESULT
+
+        try:
+            flow = self._rrg.set_and_get_flow(setpoint)
+            if flow < 0:
+                return _SET_FLOW_FAILED_RESULT
             return (self.RRG_OK, flow)
         except Exception:
-            return (self.ERROR_RRG_GET_FLOW_FAILED, -1.0)
+            return _SET_FLOW_FAILED_RESULT
+
+    def SupportsTelemetry(self) -> bool:
+        """
+        @brief Checks whether ReadTelemetry() can be used with the connected device.
+        @return True if connected and the loaded library provides RRG_ReadRegisters.
+        """
+        return self._rrg is not None and self._rrg.supports_read_block()
+
+    def ReadTelemetry(self):
+        """
+        @brief Reads the gas type, status flags, temperature and current flow rate with a
+        single MODBUS request.
+        @return A tuple (error_code, gas_id, status, temperature, flow_value). The status
+        is a combination of the rrg_base.STATUS_* flags, the temperature is in °C.
+        """
+        if self._rrg is None:
+            return _NOT_CONNECTED_TELEMETRY
+        try:
+            block = self._rrg.read_block()
+            if block is None:
+                return _GET_FLOW_FAILED_TELEMETRY
+            return (self.RRG_OK,) + block
+        except Exception:
+            return _GET_FLOW_FAILED_TELEMETRY
+
+    def TuneResponseTimeout(self) -> int:
+        """
+        @brief Shortens the response timeout to what the expected responses need.
+        @details
+        Intended to be called after the first successful exchange, once the device is known
+        to answer; a lost frame is then detected long before the configured timeout.
+        @return RRG_OK on success, or ERROR_RRG_NOT_CONNECTED if there is no connection.
+        """
+        if self._rrg is None:
+            return self.ERROR_RRG_NOT_CONNECTED
+        self._rrg.tune_response_timeout()
+        return self.RRG_OK
 
     def GetLastError(self):
         """@brief Retrieves the last error message from the RRG device."""
@@ -127,3 +201,12 @@ class RRGController:
     def IsDisconnected(self):
         """@brief Checks if the RRG device is disconnected."""
         return self._rrg is None
+
+
+# Constant error results shared by every failed GetFlow()/SetAndGetFlow()/ReadTelemetry()
+# call, so polling a disconnected or failing device does not build a new tuple each time.
+_NOT_CONNECTED_RESULT = (RRGController.ERROR_RRG_NOT_CONNECTED, -1.0)
+_GET_FLOW_FAILED_RESULT = (RRGController.ERROR_RRG_GET_FLOW_FAILED, -1.0)
+_SET_FLOW_FAILED_RESULT = (RRGController.ERROR_RRG_SET_FLOW_FAILED, -1.0)
+_NOT_CONNECTED_TELEMETRY = (RRGController.ERROR_RRG_NOT_CONNECTED, -1, 0, -1.0, -1.0)
+_GET_FLOW_FAILED_TELEMETRY = (RRGController.ERROR_RRG_GET_FLOW_FAILED, -1, 0, -1.0, -1.0)
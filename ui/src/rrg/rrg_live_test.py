@@ -6,14 +6,19 @@
 @details
 This script scans for active serial ports (e.g., "/dev/ttyUSB*"), attempts to connect
 to the gas flow regulator, sets the gas type to Helium, and then repeatedly prompts the
-user to enter a flow setpoint. It also registers a signal handler so that pressing Ctrl+C
-closes the connection cleanly.
+user to enter a flow setpoint. While waiting for input, the current flow is polled in the
+background and printed whenever it changes. It also registers a signal handler so that
+pressing Ctrl+C closes the connection cleanly.
 """
 
+import os
 import sys
 import time
 import signal
-import glob
+import ctypes
+import struct
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 from rrg_wrapper import RRG
 
@@ -21,6 +26,19 @@ from rrg_wrapper import RRG
 CONST_RRG_DEFAULT_BAUDRATE = 38400
 CONST_RRG_DEFAULT_TIMEOUT_MS = 50
 
+# Interval between background flow reads while waiting for user input.
+FLOW_POLL_INTERVAL_S = 0.1
+
+PROMPT = "\nEnter flow setpoint (or type 'exit' to quit): "
+
+# Interval between port scans where inotify is not available.
+PORT_POLL_INTERVAL_S = 2
+
+# inotify(7) constants and the fixed-size header of struct inotify_event.
+IN_CREATE = 0x00000100
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
 # Global RRG instance for signal handler cleanup.
 rrg_instance = None
 
@@ -43,14 +61,158 @@ def get_active_serial_port():
     @brief Dynamically scans for active serial ports.
     @return A valid serial port string (e.g., "/dev/ttyUSB0") or None if no active ports found.
     @details
-    This function uses glob to list files matching '/dev/ttyUSB*', which is typical for Linux USB serial devices.
+    This function walks '/dev' once with os.scandir and returns the first 'ttyUSB*' entry,
+    which is typical for Linux USB serial devices. The scan stops at the first match.
     """
-    ports = glob.glob('/dev/ttyUSB*')
-    if ports:
-        return ports[0]
+    try:
+        with os.scandir('/dev') as entries:
+            for entry in entries:
+                if entry.name.startswith('ttyUSB'):
+                    return '/dev/' + entry.name
+    except OSError:
+        pass
     return None
 
 
+def wait_for_serial_port():
+    """
+    @brief Blocks until an active serial port appears.
+    @return A valid serial port string (e.g., "/dev/ttyUSB0").
+    @details
+    On Linux an inotify watch on /dev wakes the function up as soon as a 'ttyUSB*' device
+    node is created, instead of rescanning the directory periodically. Elsewhere, or if
+    inotify cannot be set up, it falls back to scanning every PORT_POLL_INTERVAL_S seconds.
+    """
+    port = get_active_serial_port()
+    if port is not None:
+        return port
+
+    fd = -1
+    if sys.platform.startswith("linux"):
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(IN_CLOEXEC)
+        if fd >= 0 and libc.inotify_add_watch(fd, b"/dev", IN_CREATE) < 0:
+            os.close(fd)
+            fd = -1
+
+    if fd < 0:
+        while port is None:
+            time.sleep(PORT_POLL_INTERVAL_S)
+            port = get_active_serial_port()
+        return port
+
+    try:
+        # Scan once more: the device may have appeared before the watch was added.
+        port = get_active_serial_port()
+        while port is None:
+            buf = os.read(fd, 4096)
+            offset = 0
+            while offset < len(buf):
+                _, mask, _, name_len = INOTIFY_EVENT_HEADER.unpack_from(buf, offset)
+                offset += INOTIFY_EVENT_HEADER.size
+                name = buf[offset:offset + name_len].rstrip(b"\0").decode()
+                offset += name_len
+                if mask & IN_CREATE and name.startswith("ttyUSB"):
+                    port = "/dev/" + name
+                    break
+        return port
+    finally:
+        os.close(fd)
+
+
+async def poll_flow(loop, executor):
+    """
+    @brief Periodically reads the current flow and prints it when it changes.
+    @param loop The running event loop.
+    @param executor Executor that runs all blocking RRG calls.
+    """
+    last_flow = None
+    while True:
+        cur_flow = await loop.run_in_executor(executor, rrg_instance.get_flow)
+        if cur_flow >= 0 and cur_flow != last_flow:
+            print("Current flow is: {:.3f} SCCM".format(cur_flow))
+            last_flow = cur_flow
+        await asyncio.sleep(FLOW_POLL_INTERVAL_S)
+
+
+async def run_setpoint_loop():
+    """
+    @brief Reads flow setpoints from stdin without blocking the background flow polling.
+    @details
+    User input is read from the stdin fd through loop.add_reader(), and the MODBUS calls run in a
+    single-worker executor. One worker keeps the serial line to one transaction at a time,
+    while the event loop stays free to handle input. Ctrl+C ends the loop the same way
+    as typing 'exit'.
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    lines = asyncio.Queue()
+
+    stdin_fd = sys.stdin.fileno()
+    encoding = sys.stdin.encoding or "utf-8"
+    pending = bytearray()
+
+    def on_stdin():
+        # Read the fd directly: sys.stdin.readline() would buffer any further lines from
+        # the same read, and they would wait until the fd became readable again.
+        data = os.read(stdin_fd, 4096)
+        pending.extend(data)
+        *complete, rest = pending.split(b"\n")
+        pending[:] = rest
+        for line in complete:
+            lines.put_nowait(line.decode(encoding, errors="replace"))
+        if not data:
+            # EOF: stop watching stdin, it would stay readable forever.
+            loop.remove_reader(stdin_fd)
+            if pending:
+                lines.put_nowait(pending.decode(encoding, errors="replace"))
+                pending.clear()
+            lines.put_nowait(None)
+
+    loop.add_reader(stdin_fd, on_stdin)
+    loop.add_signal_handler(signal.SIGINT, lines.put_nowait, None)
+    poller = asyncio.create_task(poll_flow(loop, executor))
+
+    try:
+        while True:
+            print(PROMPT, end="", flush=True)
+            user_input = await lines.get()
+            if user_input is None:
+                break  # End loop on EOF or Ctrl+C
+
+            user_input = user_input.strip()
+            if user_input.lower() == "exit":
+                print("Exiting...")
+                break
+
+            try:
+                setpoint = float(user_input)
+            except ValueError:
+                print("Invalid input. Please enter a valid number.")
+                continue
+
+            if setpoint < 0:
+                print("Invalid flow value. Must be a positive number.")
+                continue
+
+            # Set the flow value and read back the current flow in one batched call.
+            cur_flow = await loop.run_in_executor(executor, rrg_instance.set_and_get_flow, setpoint)
+            if cur_flow >= 0:
+                print("Flow successfully set to {:.3f} SCCM".format(setpoint))
+                print("Current flow is: {:.3f} SCCM".format(cur_flow))
+            else:
+                print("Failed to set flow: {}".format(rrg_instance.get_last_error()))
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+        loop.remove_reader(stdin_fd)
+        poller.cancel()
+        try:
+            await poller
+        except asyncio.CancelledError:
+            pass
+        executor.shutdown(wait=True)
+
+
 def main():
     global rrg_instance
 
@@ -63,9 +225,8 @@ def main():
     while True:
         port = get_active_serial_port()
         if port is None:
-            print("No active serial ports found. Retrying...")
-            time.sleep(2)
-            continue
+            print("No active serial ports found. Waiting for a device...")
+            port = wait_for_serial_port()
 
         print("Found active port: {}".format(port))
 
@@ -91,38 +252,8 @@ def main():
         print("Connected successfully to {}!".format(port))
         break
 
-    # Main loop: prompt user for flow setpoints.
-    while True:
-        try:
-            user_input = input("\nEnter flow setpoint (or type 'exit' to quit): ")
-        except EOFError:
-            break  # End loop if EOF is encountered
-
-        user_input = user_input.strip()
-        if user_input.lower() == "exit":
-            print("Exiting...")
-            break
-
-        try:
-            setpoint = float(user_input)
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
-            continue
-
-        if setpoint < 0:
-            print("Invalid flow value. Must be a positive number.")
-            continue
-
-        # Set the flow value.
-        if rrg_instance.set_flow(setpoint):
-            print("Flow successfully set to {:.3f} SCCM".format(setpoint))
-        else:
-            print("Failed to set flow: {}".format(rrg_instance.get_last_error()))
-
-        # Retrieve and display the current flow.
-        cur_flow = rrg_instance.get_flow()
-        if cur_flow >= 0:
-            print("Current flow is: {:.3f} SCCM".format(cur_flow))
+    # Main loop: prompt user for flow setpoints while monitoring the flow.
+    asyncio.run(run_setpoint_loop())
 
     # Clean up before exiting.
     rrg_instance.close()
@@ -6,33 +6,31 @@
 This module loads the RRG shared library and exposes a Python interface to the
 functions defined in the RRG C API. It defines:
   - RRGConfig: A ctypes Structure mapping to the C RRG_Config struct.
-  - IRRG: An abstract interface for RRG operations.
-  - RRG: A concrete implementation of IRRG that wraps the C API.
+  - RRG: A ctypes implementation of IRRG (see rrg_base) that wraps the C API.
 """
 
 import os
 import sys
 import ctypes
 import logging
-from ctypes import CDLL, POINTER, c_char_p, c_int, c_float, c_void_p
+from functools import partial
+from ctypes import CDLL, POINTER, c_char_p, c_int, c_float, c_uint16, c_uint32, c_void_p
 
-logging.basicConfig(level=logging.DEBUG, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+if __package__:
+    from .rrg_base import IRRG, LazyMessage, lib_path, resources_dir, TELEMETRY_REGISTER_COUNT
+else:  # Imported as a top-level module, e.g. by rrg_live_test.py run as a script.
+    from rrg_base import IRRG, LazyMessage, lib_path, resources_dir, TELEMETRY_REGISTER_COUNT
+
+# Logging is configured by the application; set RRG_DEBUG to get debug records from here.
 logger = logging.getLogger(__name__)
+if os.environ.get("RRG_DEBUG"):
+    logger.setLevel(logging.DEBUG)
 
-# Determine the library filename based on the platform.
+# Let the loader resolve the library's own DLL dependencies from the resources directory.
 if os.name == "nt":
-    lib_filename = "rrg.dll"
-else:
-    lib_filename = "librrg.so"
-
-# Build the path relative to the current file's directory.
-# Assuming this file is in ui/rrg/rrg_wrapper.py, the shared library is in "../resources/"
-current_dir = os.path.dirname(os.path.abspath(__file__))
-lib_path = os.path.join(current_dir, "../..", "resources", lib_filename)
-lib_path = os.path.abspath(lib_path)
+    _dll_directory = os.add_dll_directory(str(resources_dir))
 
-# Optionally print the library path for debugging.
-print("Loading shared library from:", lib_path)
+logger.debug("Loading shared library from: %s", lib_path)
 
 # Load the shared library.
 try:
@@ -65,52 +63,57 @@ class RRGHandle(ctypes.Structure):
     ]
 
 
-class IRRG:
-    """
-    @brief Interface defining methods for interacting with the RRG device.
-    """
-    def connect(self) -> bool:
-        """
-        @brief Establishes a connection to the RRG device.
-        @return True if successful, otherwise False.
-        """
-        raise NotImplementedError
+# Configure the ctypes function signatures for the RRG API once, at import time.
+try:
+    rrg_lib.RRG_Init.argtypes = [POINTER(RRGConfig), POINTER(RRGHandle)]
+    rrg_lib.RRG_Init.restype = c_int
 
-    def set_flow(self, setpoint: float) -> bool:
-        """
-        @brief Sends a new flow setpoint to the RRG.
-        @param setpoint Desired flow rate in SCCM.
-        @return True if successful, otherwise False.
-        """
-        raise NotImplementedError
+    rrg_lib.RRG_SetFlow.argtypes = [POINTER(RRGHandle), c_float]
+    rrg_lib.RRG_SetFlow.restype = c_int
 
-    def get_flow(self) -> float:
-        """
-        @brief Retrieves the current flow rate from the RRG.
-        @return The current flow rate in SCCM, or -1.0 on error.
-        """
-        raise NotImplementedError
+    rrg_lib.RRG_GetFlow.argtypes = [POINTER(RRGHandle), POINTER(c_float)]
+    rrg_lib.RRG_GetFlow.restype = c_int
 
-    def set_gas(self, gas_id: int) -> bool:
-        """
-        @brief Sets the gas type in the RRG.
-        @param gas_id Integer representing the gas type.
-        @return True if successful, otherwise False.
-        """
-        raise NotImplementedError
+    rrg_lib.RRG_SetGas.argtypes = [POINTER(RRGHandle), c_int]
+    rrg_lib.RRG_SetGas.restype = c_int
 
-    def close(self) -> None:
-        """
-        @brief Closes the connection to the RRG device.
-        """
-        raise NotImplementedError
+    rrg_lib.RRG_Close.argtypes = [POINTER(RRGHandle)]
+    rrg_lib.RRG_Close.restype = None
+
+    rrg_lib.RRG_GetLastError.restype = c_char_p
+except AttributeError as e:
+    logger.error("Shared library is missing an RRG API function: %s", e)
+    sys.exit(f"Shared library is missing an RRG API function: {e}")
+
+# Entry points added after the first library release; older builds fall back to
+# calling the basic functions one after another.
+HAS_SET_AND_GET_FLOW = hasattr(rrg_lib, "RRG_SetAndGetFlow")
+if HAS_SET_AND_GET_FLOW:
+    rrg_lib.RRG_SetAndGetFlow.argtypes = [POINTER(RRGHandle), c_float, POINTER(c_float)]
+    rrg_lib.RRG_SetAndGetFlow.restype = c_int
+
+HAS_READ_REGISTERS = hasattr(rrg_lib, "RRG_ReadRegisters")
+if HAS_READ_REGISTERS:
+    rrg_lib.RRG_ReadRegisters.argtypes = [POINTER(RRGHandle), c_int, c_int, POINTER(c_uint16)]
+    rrg_lib.RRG_ReadRegisters.restype = c_int
+
+HAS_SET_RESPONSE_TIMEOUT = hasattr(rrg_lib, "RRG_SetResponseTimeout")
+if HAS_SET_RESPONSE_TIMEOUT:
+    rrg_lib.RRG_SetResponseTimeout.argtypes = [POINTER(RRGHandle), c_uint32, c_uint32]
+    rrg_lib.RRG_SetResponseTimeout.restype = c_int
+
+
+def _read_last_error() -> str:
+    """
+    @brief Fetches and decodes the library's last error message.
+    @return A string containing the error message.
+    """
+    err_ptr = rrg_lib.RRG_GetLastError()
+    return err_ptr.decode("utf-8") if err_ptr else "Unknown error."
 
-    def get_last_error(self) -> str:
-        """
-        @brief Retrieves the description of the last error.
-        @return A string describing the last error.
-        """
-        raise NotImplementedError
+
+# Shared by all instances: the library keeps a single, global last error.
+_LAST_ERROR = LazyMessage(_read_last_error)
 
 
 class RRG(IRRG):
@@ -118,6 +121,8 @@ class RRG(IRRG):
     @brief Python wrapper for the RRG C API.
     Provides a high-level interface to communicate with the gas flow regulator.
     """
+    _last_error = _LAST_ERROR
+
     def __init__(self, port: str, baudrate: int, slave_id: int, timeout: int) -> None:
         """
         @brief Initializes an RRG instance with the given connection parameters.
@@ -126,112 +131,47 @@ class RRG(IRRG):
         @param slave_id MODBUS slave ID.
         @param timeout Response timeout in milliseconds.
         """
-        logger.debug("Initializing RRG with port=%s, baudrate=%d, slave_id=%d, timeout=%d",
-                     port, baudrate, slave_id, timeout)
+        super().__init__(port, baudrate, slave_id, timeout)
         self._config = RRGConfig(port.encode("utf-8"), baudrate, slave_id, timeout)
         self._handle = RRGHandle()
-        self._setup_functions()
-
-    def _setup_functions(self) -> None:
-        """
-        @brief Configures the ctypes function signatures for the RRG API.
-        """
-        logger.debug("Setting up function signatures for the RRG API.")
-        rrg_lib.RRG_Init.argtypes = [POINTER(RRGConfig), POINTER(RRGHandle)]
-        rrg_lib.RRG_Init.restype = c_int
-
-        rrg_lib.RRG_SetFlow.argtypes = [POINTER(RRGHandle), c_float]
-        rrg_lib.RRG_SetFlow.restype = c_int
-
-        rrg_lib.RRG_GetFlow.argtypes = [POINTER(RRGHandle), POINTER(c_float)]
-        rrg_lib.RRG_GetFlow.restype = c_int
-
-        rrg_lib.RRG_SetGas.argtypes = [POINTER(RRGHandle), c_int]
-        rrg_lib.RRG_SetGas.restype = c_int
-
-        rrg_lib.RRG_Close.argtypes = [POINTER(RRGHandle)]
-        rrg_lib.RRG_Close.restype = None
-
-        rrg_lib.RRG_GetLastError.restype = c_char_p
-
-    def connect(self) -> bool:
-        """
-        @brief Establishes a connection with the RRG device.
-        @return True if the connection is successfully established, False otherwise.
-        """
-        logger.info("Attempting to initialize RRG device with config: port=%s, baudrate=%d, slave_id=%d, timeout=%d",
-                    self._config.port.decode('utf-8') if self._config.port else "None",
-                    self._config.baudrate, self._config.slave_id, self._config.timeout)
-        if not self._handle:
-            logger.error("RRG_Init did not create a valid handle. Last error: %s", self.get_last_error())
-            return False
-        result = rrg_lib.RRG_Init(ctypes.byref(self._config), ctypes.byref(self._handle))
-        error_message = self.get_last_error()
-        if error_message and error_message != "No error.":
-            logger.warning("RRG_GetLastError returned: %s", error_message)
-
-        logger.info("RRG device initialized successfully (result=%d).", result)
-        return result == 0
-
-    def set_flow(self, setpoint: float) -> bool:
-        """
-        @brief Sends a new flow setpoint to the RRG device.
-        @param setpoint Desired flow rate in SCCM.
-        @return True if the setpoint is successfully sent, False otherwise.
-        """
-        logger.info("Setting flow to %.3f SCCM.", setpoint)
-        result = rrg_lib.RRG_SetFlow(ctypes.byref(self._handle), c_float(setpoint))
-        if result != 0:
-            logger.error("Failed to set flow to %.3f SCCM. Error: %s", setpoint, self.get_last_error())
-        else:
-            logger.info("Flow set successfully to %.3f SCCM.", setpoint)
-        return result == 0
-
-    def get_flow(self) -> float:
-        """
-        @brief Retrieves the current flow rate from the RRG device.
-        @return The current flow rate in SCCM, or -1.0 if an error occurs.
-        """
-        flow = c_float()
-        result = rrg_lib.RRG_GetFlow(ctypes.byref(self._handle), ctypes.byref(flow))
+        # Reusable output buffers; ctypes passes arrays to pointer arguments as-is.
+        self._flow_out = (c_float * 1)()
+        self._block = (c_uint16 * TELEMETRY_REGISTER_COUNT)()
+        # References passed to every C call; created once instead of per call.
+        self._config_ref = ctypes.byref(self._config)
+        self._handle_ref = handle_ref = ctypes.byref(self._handle)
+        # Library functions bound once to the handle, so calls skip the CDLL attribute lookup.
+        self._c_set_flow = partial(rrg_lib.RRG_SetFlow, handle_ref)
+        self._c_get_flow = partial(rrg_lib.RRG_GetFlow, handle_ref)
+        self._c_set_gas = partial(rrg_lib.RRG_SetGas, handle_ref)
+        if HAS_SET_AND_GET_FLOW:
+            self._c_set_and_get_flow = partial(rrg_lib.RRG_SetAndGetFlow, handle_ref)
+        if HAS_READ_REGISTERS:
+            self._c_read_registers = partial(rrg_lib.RRG_ReadRegisters, handle_ref)
+        if HAS_SET_RESPONSE_TIMEOUT:
+            self._c_set_response_timeout = partial(rrg_lib.RRG_SetResponseTimeout, handle_ref)
+
+    def _c_init(self) -> int:
+        """
+        @brief Calls RRG_Init, clearing the handle again if it fails.
+        @return The RRG_Init result, 0 on success.
+        """
+        result = rrg_lib.RRG_Init(self._config_ref, self._handle_ref)
         if result != 0:
-            logger.error("Failed to retrieve flow (return code %d). Error: %s", result, self.get_last_error())
-            return -1.0
-        logger.info("Retrieved flow: %.3f SCCM.", flow.value)
-        return flow.value
-
-    def set_gas(self, gas_id: int) -> bool:
-        """
-        @brief Sets the gas type in the RRG device.
-        @param gas_id Gas type identifier (e.g., 7 for Helium).
-        @return True if the gas type is successfully set, False otherwise.
-        """
-        logger.info("Setting gas to ID %d.", gas_id)
-        result = rrg_lib.RRG_SetGas(ctypes.byref(self._handle), c_int(gas_id))
-        if result != 0:
-            logger.error("Failed to set gas to ID %d. Error: %s", gas_id, self.get_last_error())
-        else:
-            logger.info("Gas set successfully to ID %d.", gas_id)
-        return result == 0
+            # Never keep a stale context pointer from a failed initialization.
+            self._handle.modbus_ctx = None
+        return result
 
-    def close(self) -> None:
+    def _c_close(self) -> None:
         """
-        @brief Closes the connection to the RRG device and frees resources.
+        @brief Calls RRG_Close and clears the handle.
         """
-        if self._handle and self._handle.modbus_ctx:
-            logger.info("Closing connection to RRG device.")
-            rrg_lib.RRG_Close(ctypes.byref(self._handle))
-            self._handle.modbus_ctx = None
-            logger.info("Connection closed successfully.")
-        else:
-            logger.warning("Attempted to close RRG device, but handle is invalid or already closed.")
+        rrg_lib.RRG_Close(self._handle_ref)
+        self._handle.modbus_ctx = None
 
-    def get_last_error(self) -> str:
+    def is_connected(self) -> bool:
         """
-        @brief Retrieves the description of the last occurred error.
-        @return A string containing the error message.
+        @brief Checks whether the connection to the RRG device is open.
+        @return True if connected, otherwise False.
         """
-        err_ptr = rrg_lib.RRG_GetLastError()
-        error_str = err_ptr.decode("utf-8") if err_ptr else "Unknown error."
-        logger.debug("Retrieved last error: %s", error_str)
-        return error_str
+        return bool(self._handle.modbus_ctx)